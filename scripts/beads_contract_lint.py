@@ -10,25 +10,54 @@ Standalone — no external dependencies.
 from __future__ import annotations
 
 import argparse
+import glob
+import hashlib
+import heapq
+import itertools
 import json
+import mmap
+import os
 import pathlib
 import re
+import subprocess
 import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from typing import TextIO
 
-SECTION_PATTERNS: dict[str, re.Pattern[str]] = {
-    "Objective": re.compile(r"^#{0,6}\s*Objective\s*:?\s*$", re.IGNORECASE),
-    "Must-Haves": re.compile(
-        r"^#{0,6}\s*Must[- ]Haves(?:\s*\([^)]*\))?\s*:?\s*$", re.IGNORECASE
-    ),
-    "Non-Goals": re.compile(r"^#{0,6}\s*Non[- ]Goals\s*:?\s*$", re.IGNORECASE),
-    "Constraints": re.compile(r"^#{0,6}\s*Constraints\s*:?\s*$", re.IGNORECASE),
-    "Verification": re.compile(r"^#{0,6}\s*Verification\s*:?\s*$", re.IGNORECASE),
+from hook_common import ANCHOR_BYTES, appended_since, write_atomic
+
+# Contract section headings, combined into one alternation so each line is
+# matched at most once. Group names map to section names via SECTION_NAMES.
+SECTION_RE = re.compile(
+    r"^#{0,6}\s*(?:"
+    r"(?P<objective>Objective)"
+    r"|(?P<must_haves>Must[- ]Haves(?:\s*\([^)]*\))?)"
+    r"|(?P<non_goals>Non[- ]Goals)"
+    r"|(?P<constraints>Constraints)"
+    r"|(?P<verification>Verification)"
+    r")\s*:?\s*$",
+    re.IGNORECASE,
+)
+SECTION_NAMES = {
+    "objective": "Objective",
+    "must_haves": "Must-Haves",
+    "non_goals": "Non-Goals",
+    "constraints": "Constraints",
+    "verification": "Verification",
 }
+REQUIRED_SECTIONS = ("Objective", "Must-Haves", "Non-Goals", "Constraints", "Verification")
+REQUIRED_SET = frozenset(REQUIRED_SECTIONS)
+
+# First characters a stripped line needs before SECTION_RE can match
+HEADING_INITIALS = frozenset("#OoMmNnCcVv")
+ITEM_INITIALS = frozenset("-*0123456789")
 
 ITEM_RE = re.compile(r"^\s*(?:[-*]|\d+\.)\s+(?P<text>.+?)\s*$")
 
-# Fenced code block detection
-CODE_BLOCK_RE = re.compile(r"^```")
+# "## Acceptance Criteria" heading inside the description
+AC_HEADING_RE = re.compile(r"^#{1,6}\s*Acceptance\s+Criteria\s*:?\s*$", re.IGNORECASE)
 
 # Vague words banned in Acceptance Criteria
 VAGUE_AC_WORDS = re.compile(
@@ -39,71 +68,430 @@ VAGUE_AC_WORDS = re.compile(
 # Cross-repo path pattern (~/personal/ or absolute home paths)
 CROSS_REPO_RE = re.compile(r"~/\w+/|/Users/\w+/personal/")
 
+# Unpinned image/version tags in Constraints
+LATEST_RE = re.compile(r"\blatest\b", re.IGNORECASE)
+
 # Working directory declaration (bold, plain, or list-prefixed)
 WORKING_DIR_RE = re.compile(
     r"(?:\*\*)?Working directory(?:\*\*)?[:\s]", re.IGNORECASE
 )
 
 
-def _iter_issues(path: pathlib.Path) -> tuple[list[dict], list[str]]:
-    errors: list[str] = []
-    issues: list[dict] = []
+# Slowest issues listed by --profile unless --profile-top says otherwise
+PROFILE_TOP = 10
+
+# Issues per work unit handed to a --jobs worker process
+CHUNK_SIZE = 256
+
+# Failing issue ids listed per target by --target
+TARGET_SAMPLE = 5
+
+SKIP_STATUSES = {"closed", "cancelled", "rejected"}
+
+MERGE_MARKERS = ("<<<<<<<", "=======", ">>>>>>>")
+
+# Every "id": "..." pair in a raw JSONL line; a cheap pre-filter before json.loads
+ID_FIELD_RE = re.compile(r'"id"\s*:\s*"((?:[^"\\]|\\.)*)"')
+# A "status": "..." pair in a raw JSONL line, for the --status pre-filter
+STATUS_FIELD_RE = re.compile(r'"status"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Unix socket of beads_lint_daemon.py, next to the issues file by default
+DEFAULT_SOCKET_NAME = ".contract-lint.sock"
+DAEMON_TIMEOUT = 10.0
+
+# Bump whenever the cache file layout changes. Rule changes are picked up
+# automatically through the source fingerprint stored next to it.
+CACHE_VERSION = 1
+DEFAULT_CACHE_NAME = ".contract-lint-cache.json"
+
+# Issue fields that feed validate_issue (id/title only shape the header)
+CACHE_KEY_FIELDS = ("id", "title", "description", "acceptance_criteria")
+
+# Sidecar id -> (offset, length) index for --id lookups
+INDEX_VERSION = 1
+DEFAULT_INDEX_NAME = ".issues-index.json"
+# Leading "id" of a raw line; beads writes it first, anything else is decoded
+LEADING_ID_RE = re.compile(rb'\s*\{\s*"id"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def _parse_line(stripped: str) -> dict | tuple[str, str] | None:
+    """Decode one stripped, non-empty JSONL line.
+
+    Returns the issue dict, a (problem, detail) pair for load errors, or
+    None for valid JSON that is not an object.
+    """
+    if stripped.startswith(MERGE_MARKERS):
+        return ("merge conflict marker", "")
+    try:
+        parsed = json.loads(stripped)
+    except json.JSONDecodeError as exc:
+        return ("invalid JSON", f": {exc.msg}")
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _load_error(lineno: int, problem: tuple[str, str]) -> str:
+    return f"{problem[0]} at line {lineno}{problem[1]}"
+
+
+def _iter_issues(
+    path: pathlib.Path,
+    errors: list[str],
+    keep: Callable[[str], bool] | None = None,
+    profile: Profile | None = None,
+) -> Iterator[dict]:
+    """Stream issues from a JSONL file one line at a time.
+
+    Load problems (merge markers, invalid JSON, read failures) are appended
+    to ``errors`` as they are encountered instead of aborting the stream.
+    If ``keep`` is given, stripped lines it rejects are skipped without being
+    decoded; merge markers are still reported on every line. With
+    ``profile``, decode time is added to it.
+    """
     if not path.exists():
-        return issues, []
+        return
     try:
-        text = path.read_text(encoding="utf-8", errors="replace")
+        handle = path.open(encoding="utf-8", errors="replace")
     except OSError as exc:
-        return issues, [f"failed to read issues file: {exc}"]
+        errors.append(f"failed to read issues file: {exc}")
+        return
 
-    for lineno, line in enumerate(text.splitlines(), start=1):
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if stripped.startswith(("<<<<<<<", "=======", ">>>>>>>")):
-            errors.append(f"merge conflict marker at line {lineno}")
+    with handle:
+        for lineno, line in enumerate(handle, start=1):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if keep is not None and not (stripped.startswith(MERGE_MARKERS) or keep(stripped)):
+                continue
+            if profile is None:
+                parsed = _parse_line(stripped)
+            else:
+                started = time.perf_counter()
+                parsed = _parse_line(stripped)
+                profile.add("decode", time.perf_counter() - started)
+            if isinstance(parsed, tuple):
+                errors.append(_load_error(lineno, parsed))
+            elif parsed is not None:
+                yield parsed
+
+
+def _status_passes(value: str, status: str) -> bool:
+    """Status filter; "all" means every non-closed issue."""
+    value = value.lower()
+    if status == "all":
+        return value not in SKIP_STATUSES
+    return value == status
+
+
+def _status_matches(issue: dict, status: str) -> bool:
+    return _status_passes(str(issue.get("status", "")), status)
+
+
+def _status_filter(status: str) -> Callable[[str], bool]:
+    """Raw-line pre-filter for _iter_issues that skips lines --status drops.
+
+    A line is rejected only when its "status" pair is provably the issue's
+    own: the line is one {...} object, "status" occurs in it once, and no
+    bracket opens before it, so the pair cannot sit in a nested object.
+    Anything less certain (a nested status, a brace in an earlier string, a
+    truncated line) is decoded and left to json.loads and _select_issues.
+    """
+    def keep(stripped: str) -> bool:
+        match = STATUS_FIELD_RE.search(stripped)
+        if match is None or "\\" in match.group(1) or _status_passes(match.group(1), status):
+            return True
+        if stripped.count('"status"') != 1 or not (stripped.startswith("{") and stripped.endswith("}")):
+            return True
+        head = stripped[1 : match.start()]
+        return "{" in head or "[" in head
+
+    return keep
+
+
+def _select_issues(
+    issues: Iterable[dict], status: str, ids: set[str] | None = None
+) -> Iterator[dict]:
+    if ids is not None:
+        issues = (issue for issue in issues if str(issue.get("id", "")) in ids)
+    return (issue for issue in issues if _status_matches(issue, status))
+
+
+def _git_output(args: list[str], cwd: pathlib.Path | None = None) -> str | None:
+    """Stripped stdout of a git command, or None if it cannot run or fails."""
+    try:
+        proc = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True,
+            text=True, encoding="utf-8", errors="replace",
+        )
+    except OSError:
+        return None
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+def _tracked_path(issues_path: pathlib.Path) -> tuple[str, str] | None:
+    """(toplevel, path in it) if the committing repo tracks the issues file.
+
+    The committing repo is the one git finds from the current directory. A
+    file that is untracked, ignored, a symlink, or reached through a
+    symlink into another repo (e.g. a beads-hub checkout) yields None, as
+    its staged diff says nothing about what is being committed.
+    """
+    if issues_path.is_symlink():
+        return None
+    toplevel = _git_output(["rev-parse", "--show-toplevel"])
+    real = issues_path.resolve()
+    if not toplevel or _git_output(["rev-parse", "--show-toplevel"], real.parent) != toplevel:
+        return None
+    try:
+        relative = real.relative_to(pathlib.Path(toplevel).resolve()).as_posix()
+    except ValueError:
+        return None
+    if _git_output(["ls-files", "--error-unmatch", "--", relative], pathlib.Path(toplevel)) is None:
+        return None
+    return toplevel, relative
+
+
+def _changed_issues(
+    issues_path: pathlib.Path, since: str | None = None
+) -> tuple[set[str], set[str]] | None:
+    """Lines and ids added or modified in the staged diff of the issues file.
+
+    With ``since``, diffs the working tree against that revision instead of
+    the index against HEAD. Returns (stripped added lines, issue ids), or
+    None if git cannot produce the diff, including when the committing repo
+    does not track the file (see _tracked_path).
+    """
+    tracked = _tracked_path(issues_path)
+    if tracked is None:
+        return None
+    toplevel, relative = tracked
+    cmd = ["git", "diff", "--no-color", "--no-ext-diff", "-U0"]
+    cmd += [since] if since else ["--cached"]
+    cmd += ["--", relative]
+    try:
+        proc = subprocess.run(
+            cmd, cwd=toplevel, capture_output=True,
+            text=True, encoding="utf-8", errors="replace",
+        )
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        return None
+
+    lines: set[str] = set()
+    ids: set[str] = set()
+    for line in proc.stdout.splitlines():
+        # "+++ b/<file>" is the header; added JSONL lines start with "+{"
+        if not line.startswith("+") or line.startswith("+++"):
             continue
-        try:
-            parsed = json.loads(stripped)
-        except json.JSONDecodeError as exc:
-            errors.append(f"invalid JSON at line {lineno}: {exc.msg}")
+        stripped = line[1:].strip()
+        if not stripped:
             continue
-        if isinstance(parsed, dict):
-            issues.append(parsed)
-    return issues, errors
+        lines.add(stripped)
+        parsed = _parse_line(stripped)
+        if isinstance(parsed, dict) and "id" in parsed:
+            ids.add(str(parsed["id"]))
+    return lines, ids
 
 
-def _extract_section_blocks(text: str) -> tuple[dict[str, list[str]], list[str]]:
-    lines = text.splitlines()
-    errors: list[str] = []
-    section_starts: list[tuple[int, str]] = []
+def _changed_filter(lines: set[str], ids: set[str]) -> Callable[[str], bool]:
+    """Raw-line pre-filter for _iter_issues: added lines or lines naming an id.
 
-    for idx, line in enumerate(lines):
-        stripped = line.strip()
-        for section, pattern in SECTION_PATTERNS.items():
-            if pattern.match(stripped):
-                section_starts.append((idx, section))
-                break
+    Matching ids as well as line text keeps issues whose working-tree line
+    differs from the staged one; _select_issues then checks the id exactly.
+    """
+    def keep(stripped: str) -> bool:
+        if stripped in lines:
+            return True
+        for raw in ID_FIELD_RE.findall(stripped):
+            if "\\" in raw:
+                try:
+                    raw = json.loads(f'"{raw}"')
+                except ValueError:
+                    continue
+            if raw in ids:
+                return True
+        return False
 
-    seen: set[str] = set()
-    for _, section in section_starts:
-        if section in seen:
-            errors.append(f"duplicate section: {section}")
-        seen.add(section)
+    return keep
 
-    if errors:
-        return {}, errors
 
-    blocks: dict[str, list[str]] = {}
-    section_starts.sort(key=lambda t: t[0])
-    for i, (start_idx, section) in enumerate(section_starts):
-        end_idx = section_starts[i + 1][0] if i + 1 < len(section_starts) else len(lines)
-        content = lines[start_idx + 1 : end_idx]
-        while content and not content[0].strip():
-            content = content[1:]
-        while content and not content[-1].strip():
-            content = content[:-1]
-        blocks[section] = content
-    return blocks, []
+class Profile:
+    """Per-rule timings and call counts collected by --profile.
+
+    Times are perf_counter seconds. validate_issue laps the clock after each
+    rule; --jobs workers fill their own Profile and the parent merges them.
+    """
+
+    def __init__(self, top: int = PROFILE_TOP) -> None:
+        self.top = top
+        self.timings: dict[str, list] = {}  # name -> [calls, seconds]
+        self.slowest: list[tuple[float, str]] = []  # min-heap of (seconds, id)
+        self.validated = 0
+        self.cached = 0
+        self._mark = 0.0
+
+    def add(self, name: str, seconds: float) -> None:
+        entry = self.timings.get(name)
+        if entry is None:
+            self.timings[name] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def start(self) -> float:
+        self._mark = time.perf_counter()
+        return self._mark
+
+    def lap(self, name: str) -> None:
+        now = time.perf_counter()
+        self.add(name, now - self._mark)
+        self._mark = now
+
+    def issue_done(self, issue_id: str, seconds: float) -> None:
+        self.validated += 1
+        self._rank(issue_id, seconds)
+
+    def _rank(self, issue_id: str, seconds: float) -> None:
+        if len(self.slowest) < self.top:
+            heapq.heappush(self.slowest, (seconds, issue_id))
+        elif self.slowest and seconds > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (seconds, issue_id))
+
+    def merge(self, other: Profile) -> None:
+        for name, (calls, seconds) in other.timings.items():
+            entry = self.timings.setdefault(name, [0, 0.0])
+            entry[0] += calls
+            entry[1] += seconds
+        for seconds, issue_id in other.slowest:
+            self._rank(issue_id, seconds)
+        self.validated += other.validated
+        self.cached += other.cached
+
+    def as_dict(self, wall: float) -> dict:
+        return {
+            "wall_seconds": wall,
+            "validated": self.validated,
+            "cached": self.cached,
+            "decode": dict(zip(("calls", "seconds"), self.timings.get("decode", [0, 0.0]))),
+            "rules": {
+                name: {"calls": calls, "seconds": seconds}
+                for name, (calls, seconds) in self.timings.items()
+                if name != "decode"
+            },
+            "slowest": [
+                {"id": issue_id, "seconds": seconds}
+                for seconds, issue_id in sorted(self.slowest, reverse=True)
+            ],
+        }
+
+    def print_table(self, wall: float, out: TextIO = sys.stderr) -> None:
+        data = self.as_dict(wall)
+        decode = data["decode"]
+        print(
+            f"\n[PROFILE] {data['validated']} validated, {data['cached']} cached, "
+            f"{decode['calls']} lines decoded in {decode['seconds'] * 1000:.1f} ms, "
+            f"wall {wall * 1000:.1f} ms",
+            file=out,
+        )
+        rules = data["rules"]
+        total = sum(rule["seconds"] for rule in rules.values()) or 1.0
+        print(f"  {'rule':<28} {'calls':>8} {'total ms':>10} {'mean us':>9} {'share':>7}", file=out)
+        for name, rule in sorted(rules.items(), key=lambda item: -item[1]["seconds"]):
+            print(
+                f"  {name:<28} {rule['calls']:>8} {rule['seconds'] * 1000:>10.1f} "
+                f"{rule['seconds'] / rule['calls'] * 1e6:>9.1f} {rule['seconds'] / total:>7.1%}",
+                file=out,
+            )
+        if data["slowest"]:
+            print(f"  slowest {len(data['slowest'])} issues:", file=out)
+            for entry in data["slowest"]:
+                print(f"  {entry['seconds'] * 1000:>10.3f} ms  {entry['id']}", file=out)
+
+
+class _Block:
+    """Body of one contract section, classified line by line."""
+
+    __slots__ = ("lines", "items", "fences", "nonblank")
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.items: list[str] = []
+        self.fences = 0
+        self.nonblank = 0
+
+
+class _Description:
+    """Result of a single pass over an issue description."""
+
+    __slots__ = ("blocks", "errors", "ac_lines", "ac_items")
+
+    def __init__(self) -> None:
+        self.blocks: dict[str, _Block] = {}
+        self.errors: list[str] = []
+        # Lines after the first "## Acceptance Criteria" heading, if any
+        self.ac_lines: list[str] | None = None
+        self.ac_items = 0
+
+
+def _scan_description(text: str) -> _Description:
+    """Classify every line once (heading, list item, code fence, plain).
+
+    Each line is attributed to the section it belongs to and, once an
+    Acceptance Criteria heading has been seen, to the description AC text.
+    Duplicate section headings are reported and leave ``blocks`` empty.
+    """
+    parsed = _Description()
+    blocks = parsed.blocks
+    block: _Block | None = None
+    ac_lines: list[str] | None = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        item: str | None = None
+        fence = False
+        if stripped:
+            first = stripped[0]
+            if first in ITEM_INITIALS:
+                match = ITEM_RE.match(line)
+                if match:
+                    item = match.group("text").strip() or None
+            elif first == "`":
+                fence = stripped.startswith("```")
+            elif first in HEADING_INITIALS:
+                match = SECTION_RE.match(stripped)
+                if match:
+                    section = SECTION_NAMES[match.lastgroup]
+                    if section in blocks:
+                        parsed.errors.append(f"duplicate section: {section}")
+                    block = blocks[section] = _Block()
+                    if ac_lines is not None:
+                        ac_lines.append(line)
+                    continue
+                if ac_lines is None and first == "#" and AC_HEADING_RE.match(line):
+                    ac_lines = []
+                    if block is not None:
+                        block.lines.append(line)
+                        block.nonblank += 1
+                    continue
+
+        if ac_lines is not None:
+            ac_lines.append(line)
+            if item:
+                parsed.ac_items += 1
+        if block is None:
+            continue
+        block.lines.append(line)
+        if stripped:
+            block.nonblank += 1
+            if item:
+                block.items.append(item)
+            elif fence:
+                block.fences += 1
+
+    if parsed.errors:
+        parsed.blocks = {}
+    parsed.ac_lines = ac_lines
+    return parsed
 
 
 def _count_items(lines: list[str]) -> list[str]:
@@ -117,167 +505,637 @@ def _count_items(lines: list[str]) -> list[str]:
     return items
 
 
-def _has_code_block(lines: list[str]) -> bool:
-    """Check if lines contain a fenced code block (```)."""
-    count = sum(1 for ln in lines if CODE_BLOCK_RE.match(ln.strip()))
-    return count >= 2  # opening + closing
+def _get_ac_text(issue: dict, parsed: _Description) -> tuple[str, bool]:
+    """Get acceptance criteria text and whether it has bullet items.
 
-
-def _get_ac_text(issue: dict, description: str) -> str:
-    """Get acceptance criteria text from beads field or description section."""
+    The beads field wins when it has items; otherwise fall back to the
+    ``## Acceptance Criteria`` section of the description.
+    """
     acceptance = str(issue.get("acceptance_criteria", "") or "")
     if _count_items(acceptance.splitlines()):
-        return acceptance
-    ac_match = re.search(
-        r"^#{1,6}\s*Acceptance\s+Criteria\s*:?\s*$",
-        description,
-        re.IGNORECASE | re.MULTILINE,
-    )
-    if ac_match:
-        return description[ac_match.end():]
-    return ""
+        return acceptance, True
+    if parsed.ac_lines is not None:
+        return "\n".join(parsed.ac_lines), parsed.ac_items > 0
+    return "", False
 
 
-def validate_issue(issue: dict) -> tuple[list[str], list[str]]:
-    """Validate issue. Returns (errors, warnings)."""
-    errors: list[str] = []
-    warnings: list[str] = []
-    issue_id = str(issue.get("id", "")).strip() or "<no-id>"
-    title = str(issue.get("title", "") or "").strip()
-    header = f"{issue_id}: {title}" if title else issue_id
+# ── Rule registry ───────────────────────────────────────────────
+#
+# Each rule declares the parsed input it checks (see INPUTS); _evaluate
+# computes an input only when the first selected rule needing it runs, and
+# skips rules whose input is unavailable (None). A rule returns a message or
+# None; gate rules return a list of messages and stop evaluation when it is
+# non-empty.
+
+
+class Rule:
+    __slots__ = ("name", "severity", "needs", "check", "gate")
+
+    def __init__(
+        self, name: str, severity: str, needs: str, check: Callable, gate: bool
+    ) -> None:
+        self.name = name
+        self.severity = severity
+        self.needs = needs
+        self.check = check
+        self.gate = gate
+
+
+# Registration order is evaluation and report order
+RULES: dict[str, Rule] = {}
+SEVERITIES = ("error", "warning")
+
+
+def _rule(name: str, severity: str, needs: str, gate: bool = False) -> Callable:
+    def register(check: Callable) -> Callable:
+        RULES[name] = Rule(name, severity, needs, check, gate)
+        return check
+
+    return register
+
+
+def _input_description(issue: dict, values: dict) -> str:
+    return str(issue.get("description", "") or "")
 
-    description = str(issue.get("description", "") or "")
-    blocks, block_errors = _extract_section_blocks(description)
-    if block_errors:
-        return [header] + block_errors, []
 
-    required = ["Objective", "Must-Haves", "Non-Goals", "Constraints", "Verification"]
-    for section in required:
-        if section not in blocks:
-            errors.append(f"missing section: {section}")
+def _input_outline(issue: dict, values: dict) -> _Description:
+    return _scan_description(_need(issue, values, "description"))
 
-    if any(e.startswith("missing section:") for e in errors):
-        return [header] + errors, []
 
-    obj_lines = [ln.strip() for ln in blocks.get("Objective", []) if ln.strip()]
-    if not obj_lines:
-        errors.append("Objective is empty")
+def _input_sections(issue: dict, values: dict) -> dict[str, _Block] | None:
+    """Section blocks, or None unless every required section is present once."""
+    blocks = _need(issue, values, "outline").blocks
+    return blocks if blocks.keys() >= REQUIRED_SET else None
 
-    must_haves = _count_items(blocks.get("Must-Haves", []))
+
+def _input_acceptance(issue: dict, values: dict) -> tuple[str, bool]:
+    return _get_ac_text(issue, _need(issue, values, "outline"))
+
+
+INPUTS: dict[str, Callable[[dict, dict], object]] = {
+    "description": _input_description,
+    "outline": _input_outline,
+    "sections": _input_sections,
+    "acceptance": _input_acceptance,
+}
+
+
+def _need(issue: dict, values: dict, name: str) -> object:
+    if name not in values:
+        values[name] = INPUTS[name](issue, values)
+    return values[name]
+
+
+@_rule("unique-sections", "error", "outline", gate=True)
+def _unique_sections(outline: _Description) -> list[str]:
+    return outline.errors
+
+
+@_rule("required-sections", "error", "outline", gate=True)
+def _required_sections(outline: _Description) -> list[str] | None:
+    if outline.errors:
+        return None  # duplicates leave the outline empty
+    return [
+        f"missing section: {section}"
+        for section in REQUIRED_SECTIONS
+        if section not in outline.blocks
+    ]
+
+
+@_rule("objective-not-empty", "error", "sections")
+def _objective_not_empty(sections: dict[str, _Block]) -> str | None:
+    if not sections["Objective"].nonblank:
+        return "Objective is empty"
+    return None
+
+
+@_rule("must-haves-count", "error", "sections")
+def _must_haves_count(sections: dict[str, _Block]) -> str | None:
+    must_haves = sections["Must-Haves"].items
     if not must_haves:
-        errors.append("Must-Haves must contain 1-3 bullet items")
-    elif len(must_haves) > 3:
-        errors.append(f"Must-Haves has {len(must_haves)} items (max 3)")
+        return "Must-Haves must contain 1-3 bullet items"
+    if len(must_haves) > 3:
+        return f"Must-Haves has {len(must_haves)} items (max 3)"
+    return None
 
-    if not _count_items(blocks.get("Non-Goals", [])):
-        errors.append("Non-Goals needs at least 1 item (use '- None' if needed)")
 
-    if not _count_items(blocks.get("Constraints", [])):
-        errors.append("Constraints needs at least 1 item (use '- None' if needed)")
+@_rule("non-goals-present", "error", "sections")
+def _non_goals_present(sections: dict[str, _Block]) -> str | None:
+    if not sections["Non-Goals"].items:
+        return "Non-Goals needs at least 1 item (use '- None' if needed)"
+    return None
 
-    if not _count_items(blocks.get("Verification", [])):
-        errors.append("Verification needs at least 1 command/check")
 
-    # Check acceptance_criteria: beads field first, then ## Acceptance Criteria in description
-    ac_text = _get_ac_text(issue, description)
-    if not _count_items(ac_text.splitlines()):
-        errors.append("Acceptance Criteria is missing or has no bullet items")
+@_rule("constraints-present", "error", "sections")
+def _constraints_present(sections: dict[str, _Block]) -> str | None:
+    if not sections["Constraints"].items:
+        return "Constraints needs at least 1 item (use '- None' if needed)"
+    return None
 
-    # ── New rules (warnings) ─────────────────────────────────────
 
-    # Rule 1: verification-has-code-block (ERROR)
-    # Verification section should contain a fenced ```bash block
-    verification_lines = blocks.get("Verification", [])
-    if verification_lines and not _has_code_block(verification_lines):
-        errors.append(
-            "Verification should contain a ```bash code block with runnable commands"
-        )
+@_rule("verification-present", "error", "sections")
+def _verification_present(sections: dict[str, _Block]) -> str | None:
+    if not sections["Verification"].items:
+        return "Verification needs at least 1 command/check"
+    return None
+
+
+# Beads field first, then ## Acceptance Criteria in description
+@_rule("acceptance-criteria-items", "error", "acceptance")
+def _acceptance_criteria_items(acceptance: tuple[str, bool]) -> str | None:
+    if not acceptance[1]:
+        return "Acceptance Criteria is missing or has no bullet items"
+    return None
+
+
+# Verification section should contain a fenced ```bash block
+@_rule("verification-has-code-block", "error", "sections")
+def _verification_has_code_block(sections: dict[str, _Block]) -> str | None:
+    verification = sections["Verification"]
+    if verification.nonblank and verification.fences < 2:
+        return "Verification should contain a ```bash code block with runnable commands"
+    return None
+
 
-    # Rule 2: non-goals-minimum (WARNING)
-    # Non-Goals should have 3+ items to prevent scope creep
-    non_goals = _count_items(blocks.get("Non-Goals", []))
+# Non-Goals should have 3+ items to prevent scope creep
+@_rule("non-goals-minimum", "warning", "sections")
+def _non_goals_minimum(sections: dict[str, _Block]) -> str | None:
+    non_goals = sections["Non-Goals"].items
     if 1 <= len(non_goals) < 3:
-        warnings.append(
+        return (
             f"Non-Goals has only {len(non_goals)} item(s) — consider 3+ to prevent agent scope creep"
         )
+    return None
 
-    # Rule 3: cross-repo-working-dir (WARNING)
-    # If description mentions paths outside this repo, must have Working directory
+
+# If description mentions paths outside this repo, must have Working directory
+@_rule("cross-repo-working-dir", "warning", "description")
+def _cross_repo_working_dir(description: str) -> str | None:
     if CROSS_REPO_RE.search(description) and not WORKING_DIR_RE.search(description):
-        warnings.append(
-            "Description references external paths but no **Working directory:** declared"
-        )
+        return "Description references external paths but no **Working directory:** declared"
+    return None
 
-    # Rule 4: acceptance-no-vague-words (WARNING)
-    # Acceptance criteria should not contain subjective words
-    if ac_text:
-        vague_matches = VAGUE_AC_WORDS.findall(ac_text)
-        if vague_matches:
-            words = ", ".join(sorted(set(w.lower() for w in vague_matches)))
-            warnings.append(
-                f"Acceptance Criteria has vague words: {words} — use measurable outcomes"
-            )
 
-    # Rule 5: constraints-version-pinned (WARNING)
-    # If constraints mention docker images or versions, should have pinned tags
-    constraints_text = "\n".join(blocks.get("Constraints", []))
-    if re.search(r"\blatest\b", constraints_text, re.IGNORECASE):
-        warnings.append(
-            "Constraints mention 'latest' — pin exact versions (e.g., node:22, alpine:3.20)"
-        )
+# Acceptance criteria should not contain subjective words
+@_rule("acceptance-no-vague-words", "warning", "acceptance")
+def _acceptance_no_vague_words(acceptance: tuple[str, bool]) -> str | None:
+    ac_text = acceptance[0]
+    if not ac_text:
+        return None
+    vague_matches = VAGUE_AC_WORDS.findall(ac_text)
+    if not vague_matches:
+        return None
+    words = ", ".join(sorted(set(w.lower() for w in vague_matches)))
+    return f"Acceptance Criteria has vague words: {words} — use measurable outcomes"
+
+
+# If constraints mention docker images or versions, should have pinned tags
+@_rule("constraints-version-pinned", "warning", "sections")
+def _constraints_version_pinned(sections: dict[str, _Block]) -> str | None:
+    if LATEST_RE.search("\n".join(sections["Constraints"].lines)):
+        return "Constraints mention 'latest' — pin exact versions (e.g., node:22, alpine:3.20)"
+    return None
+
+
+ALL_RULES = tuple(RULES.values())
+
+
+def select_rules(
+    include: Iterable[str] | None = None, exclude: Iterable[str] = ()
+) -> tuple[Rule, ...]:
+    """Rules named in include (all if None) minus exclude, in registry order.
 
+    Names may also be a severity ("error", "warning") standing for every
+    rule of that severity. Raises ValueError for unknown names.
+    """
+
+    def expand(names: Iterable[str]) -> set[str]:
+        expanded: set[str] = set()
+        for name in names:
+            if name in SEVERITIES:
+                expanded.update(r.name for r in ALL_RULES if r.severity == name)
+            elif name in RULES:
+                expanded.add(name)
+            else:
+                raise ValueError(f"unknown rule '{name}'")
+        return expanded
+
+    wanted = expand(include) if include is not None else set(RULES)
+    wanted -= expand(exclude)
+    return tuple(r for r in ALL_RULES if r.name in wanted)
+
+
+def _evaluate(
+    issue: dict, rules: tuple[Rule, ...], profile: Profile | None = None
+) -> list[tuple[Rule, str]]:
+    """Run rules against one issue; returns (rule, message) findings in order."""
+    values: dict[str, object] = {}
+    findings: list[tuple[Rule, str]] = []
+    for rule in rules:
+        needs = rule.needs
+        if needs in values:
+            value = values[needs]
+        else:
+            value = values[needs] = INPUTS[needs](issue, values)
+            if profile is not None:
+                profile.lap(f"[{needs}]")
+        if value is None:
+            continue
+        result = rule.check(value)
+        if profile is not None:
+            profile.lap(rule.name)
+        if not result:
+            continue
+        if rule.gate:
+            findings.extend((rule, message) for message in result)
+            return findings
+        findings.append((rule, result))
+    return findings
+
+
+def validate_issue(
+    issue: dict, profile: Profile | None = None, rules: tuple[Rule, ...] = ALL_RULES
+) -> tuple[list[str], list[str]]:
+    """Validate issue. Returns (errors, warnings).
+
+    With ``profile``, the time spent in each rule and input and on the whole
+    issue is added to it; without one the only cost is a few ``is None``
+    checks.
+    """
+    if profile is None:
+        findings = _evaluate(issue, rules)
+    else:
+        started = profile.start()
+        findings = _evaluate(issue, rules, profile)
+        profile.issue_done(str(issue.get("id", "")), time.perf_counter() - started)
+    if not findings:
+        return [], []
+
+    issue_id = str(issue.get("id", "")).strip() or "<no-id>"
+    title = str(issue.get("title", "") or "").strip()
+    header = f"{issue_id}: {title}" if title else issue_id
+    errors = [message for rule, message in findings if rule.severity == "error"]
+    warnings = [message for rule, message in findings if rule.severity == "warning"]
     if errors:
         return [header] + errors, warnings
-    if warnings:
-        return [], [header] + warnings
-    return [], []
+    return [], [header] + warnings
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Lint beads issues for scope contracts.")
-    parser.add_argument(
-        "--issues-file", default=".beads/issues.jsonl",
-        help="Path to issues JSONL (default: .beads/issues.jsonl)",
-    )
-    parser.add_argument(
-        "--status", choices=["open", "in_progress", "all"], default="all",
-        help="Filter by status (default: all non-closed)",
-    )
-    args = parser.parse_args()
+def _rules_fingerprint() -> str:
+    """Hash of this module's source, so any rule edit invalidates the cache."""
+    try:
+        return hashlib.sha256(pathlib.Path(__file__).read_bytes()).hexdigest()[:16]
+    except OSError:
+        return "unknown"
 
-    issues_path = pathlib.Path(args.issues_file).expanduser().resolve()
-    issues, load_errors = _iter_issues(issues_path)
-    if load_errors:
-        for err in load_errors:
-            print(f"[ERROR] {err}", file=sys.stderr)
-        return 2
 
-    # Lint all non-closed issues (open + in_progress)
-    skip_statuses = {"closed", "cancelled", "rejected"}
-    if args.status == "all":
-        selected = [i for i in issues if str(i.get("status", "")).lower() not in skip_statuses]
-    else:
-        selected = [i for i in issues if str(i.get("status", "")).lower() == args.status]
+def _issue_digest(issue: dict, selection: str = "") -> str:
+    digest = hashlib.sha256(selection.encode("utf-8"))
+    for field in CACHE_KEY_FIELDS:
+        value = str(issue.get(field, "") or "")
+        digest.update(value.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
 
-    if not selected:
-        return 0
 
-    failed = False
+class LintCache:
+    """Persistent map of issue id -> (content digest, errors, warnings).
+
+    The cache is advisory: unreadable, corrupt or outdated files are treated
+    as empty, and failures to write it never fail the lint run. A rule
+    subset is folded into the digest, so its results never answer a run
+    with a different selection.
+    """
+
+    def __init__(self, path: pathlib.Path, rules: tuple[Rule, ...] = ALL_RULES) -> None:
+        self.path = path
+        self.rules = _rules_fingerprint()
+        self.selection = "" if rules == ALL_RULES else ",".join(r.name for r in rules)
+        self._entries: dict[str, list] = {}
+        self._seen: dict[str, list] = {}
+        self._dirty = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(data, dict)
+            and data.get("version") == CACHE_VERSION
+            and data.get("rules") == self.rules
+            and isinstance(data.get("entries"), dict)
+        ):
+            self._entries = data["entries"]
+
+    def get(self, issue: dict) -> tuple[list[str], list[str]] | None:
+        issue_id = str(issue.get("id", ""))
+        entry = self._entries.get(issue_id)
+        if not entry or len(entry) != 3 or entry[0] != _issue_digest(issue, self.selection):
+            return None
+        self._seen[issue_id] = entry
+        return entry[1], entry[2]
+
+    def put(self, issue: dict, result: tuple[list[str], list[str]]) -> None:
+        errors, warnings = result
+        self._seen[str(issue.get("id", ""))] = [_issue_digest(issue, self.selection), errors, warnings]
+        self._dirty = True
+
+    def save(self, prune: bool = False) -> None:
+        """Write the cache; with ``prune`` drop entries not seen in this run."""
+        if not self._dirty and not (prune and len(self._seen) < len(self._entries)):
+            return
+        entries = self._seen if prune else {**self._entries, **self._seen}
+        payload = {"version": CACHE_VERSION, "rules": self.rules, "entries": entries}
+        try:
+            write_atomic(self.path, json.dumps(payload, separators=(",", ":")))
+        except OSError:
+            pass
+
+
+class IssueIndex:
+    """Sidecar map of issue id -> (byte offset, length) into the issues file.
+
+    Alongside the offsets it stores the file's inode, size and mtime and an
+    anchor of the bytes just before the indexed end. If the file only grew,
+    refresh() scans just the appended bytes; any other change rebuilds the
+    index. Like LintCache it is advisory and write failures are ignored.
+    """
+
+    def __init__(self, issues_path: pathlib.Path, path: pathlib.Path) -> None:
+        self.issues_path = issues_path
+        self.path = path
+        self._dirty = False
+        self._reset()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(data, dict)
+            and data.get("version") == INDEX_VERSION
+            and isinstance(data.get("file"), list)
+            and isinstance(data.get("end"), int)
+            and isinstance(data.get("anchor"), str)
+            and isinstance(data.get("offsets"), dict)
+        ):
+            self._file = data["file"]
+            self._end = data["end"]
+            self._anchor = bytes.fromhex(data["anchor"])
+            self.offsets = data["offsets"]
+
+    def _reset(self) -> None:
+        self.offsets: dict[str, list[int]] = {}
+        self._file: list[int] | None = None  # [inode, size, mtime_ns]
+        self._end = 0  # end of the last complete line indexed
+        self._anchor = b""
+
+    def refresh(self, rebuild: bool = False) -> None:
+        """Bring the index up to date with the issues file."""
+        if rebuild:
+            self._reset()
+            self._dirty = True
+        st = os.stat(self.issues_path)
+        signature = [st.st_ino, st.st_size, st.st_mtime_ns]
+        if signature == self._file:
+            return
+        self._dirty = True
+        if st.st_size == 0:
+            self._reset()
+            self._file = signature
+            return
+        with open(self.issues_path, "rb") as handle, mmap.mmap(
+            handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            if not appended_since(handle.fileno(), st, self._file, self._end, self._anchor):
+                self._reset()
+            self._scan(mm)
+        self._file = signature
+
+    def _scan(self, mm: mmap.mmap) -> None:
+        pos = self._end
+        size = len(mm)
+        while pos < size:
+            newline = mm.find(b"\n", pos)
+            if newline == -1:
+                # Index a trailing partial line, but rescan it next time
+                self._add(mm, pos, size)
+                break
+            self._add(mm, pos, newline)
+            pos = newline + 1
+        self._end = pos
+        self._anchor = mm[max(0, pos - ANCHOR_BYTES):pos]
+
+    def _add(self, mm: mmap.mmap, start: int, stop: int) -> None:
+        match = LEADING_ID_RE.match(mm, start, stop)
+        if match and b"\\" not in match.group(1):
+            issue_id = match.group(1).decode("utf-8", errors="replace")
+        else:
+            stripped = mm[start:stop].decode("utf-8", errors="replace").strip()
+            parsed = _parse_line(stripped) if stripped else None
+            if not isinstance(parsed, dict) or "id" not in parsed:
+                return
+            issue_id = str(parsed["id"])
+        # Later lines win, matching a later update of the same issue
+        self.offsets[issue_id] = [start, stop - start]
+
+    def lookup(self, ids: Iterable[str]) -> dict[str, dict] | None:
+        """Decode only the lines of the requested ids that are indexed.
+
+        Returns None if an indexed line no longer holds its issue, i.e. the
+        file changed in a way the fingerprint did not catch.
+        """
+        wanted = [(issue_id, self.offsets[issue_id]) for issue_id in ids if issue_id in self.offsets]
+        if not wanted:
+            return {}
+        found: dict[str, dict] = {}
+        with open(self.issues_path, "rb") as handle, mmap.mmap(
+            handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            for issue_id, (offset, length) in wanted:
+                stripped = mm[offset:offset + length].decode("utf-8", errors="replace").strip()
+                parsed = _parse_line(stripped) if stripped else None
+                if not isinstance(parsed, dict) or str(parsed.get("id", "")) != issue_id:
+                    return None
+                found[issue_id] = parsed
+        return found
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {
+            "version": INDEX_VERSION,
+            "file": self._file,
+            "end": self._end,
+            "anchor": self._anchor.hex(),
+            "offsets": self.offsets,
+        }
+        try:
+            write_atomic(self.path, json.dumps(payload, separators=(",", ":")))
+        except OSError:
+            pass
+
+
+def _read_by_id(index: IssueIndex, ids: list[str], errors: list[str]) -> Iterator[dict]:
+    """Yield the requested issues in request order via the sidecar index.
+
+    Unknown ids and read failures are appended to ``errors``. A stale index
+    is rebuilt once and the lookup retried.
+    """
+    try:
+        index.refresh()
+        found = index.lookup(ids)
+        if found is None:
+            index.refresh(rebuild=True)
+            found = index.lookup(ids) or {}
+    except FileNotFoundError:
+        found = {}
+    except (OSError, ValueError) as exc:
+        errors.append(f"failed to read issues file: {exc}")
+        return
+    index.save()
+    for issue_id in dict.fromkeys(ids):
+        if issue_id in found:
+            yield found[issue_id]
+        else:
+            errors.append(f"issue not found: {issue_id}")
+
+
+def _chunked(items: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _validate_chunk(
+    chunk: list[dict], rule_names: tuple[str, ...], profile_top: int | None = None
+) -> tuple[list[tuple[list[str], list[str]]], Profile | None]:
+    rules = tuple(RULES[name] for name in rule_names)
+    profile = Profile(profile_top) if profile_top is not None else None
+    return [validate_issue(issue, profile, rules) for issue in chunk], profile
+
+
+def _validate_stream(
+    issues: Iterable[dict],
+    jobs: int = 1,
+    cache: LintCache | None = None,
+    profile: Profile | None = None,
+    rules: tuple[Rule, ...] = ALL_RULES,
+) -> Iterator[tuple[list[str], list[str]]]:
+    """Validate issues lazily, yielding results in input order.
+
+    Cache hits are answered in this process; only misses are validated. With
+    ``jobs > 1`` misses are fanned out over a process pool in chunks. At most
+    ``2 * jobs`` chunks are in flight, so memory stays bounded no matter how
+    large the input stream is. Worker profiles are merged into ``profile``.
+    """
+    if jobs <= 1:
+        for issue in issues:
+            result = cache.get(issue) if cache else None
+            if result is None:
+                result = validate_issue(issue, profile, rules)
+                if cache:
+                    cache.put(issue, result)
+            elif profile is not None:
+                profile.cached += 1
+            yield result
+        return
+
+    # Imported here: concurrent.futures costs more to import than a small lint run
+    from concurrent.futures import ProcessPoolExecutor
+
+    def collect(chunk: list[dict], cached: list, future) -> Iterator[tuple[list[str], list[str]]]:
+        fresh: Iterator = iter(())
+        if future:
+            results, worker_profile = future.result()
+            fresh = iter(results)
+            if profile is not None and worker_profile is not None:
+                profile.merge(worker_profile)
+        for issue, result in zip(chunk, cached):
+            if result is None:
+                result = next(fresh)
+                if cache:
+                    cache.put(issue, result)
+            yield result
+
+    rule_names = tuple(rule.name for rule in rules)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending: deque = deque()
+        try:
+            for chunk in _chunked(issues, CHUNK_SIZE):
+                cached = [cache.get(issue) if cache else None for issue in chunk]
+                misses = [issue for issue, result in zip(chunk, cached) if result is None]
+                if profile is not None:
+                    profile.cached += len(chunk) - len(misses)
+                future = (
+                    pool.submit(
+                        _validate_chunk, misses, rule_names, profile.top if profile else None
+                    )
+                    if misses
+                    else None
+                )
+                pending.append((chunk, cached, future))
+                if len(pending) >= 2 * jobs:
+                    yield from collect(*pending.popleft())
+            while pending:
+                yield from collect(*pending.popleft())
+        finally:
+            # Closed early (error budget spent): drop chunks not started yet
+            for _, _, future in pending:
+                if future:
+                    future.cancel()
+
+
+def _stop(results: Iterable, max_errors: int, failed: int) -> bool:
+    """True, after closing ``results``, once ``failed`` reaches the error budget."""
+    if not max_errors or failed < max_errors:
+        return False
+    close = getattr(results, "close", None)
+    if close is not None:
+        close()
+    return True
+
+
+def report(
+    results: Iterable[tuple[list[str], list[str]]],
+    load_errors: list[str],
+    out: TextIO = sys.stderr,
+    max_errors: int = 0,
+) -> int:
+    """Print lint results as they arrive and return the exit code.
+
+    ``load_errors`` is read after ``results`` is exhausted, so it may be
+    filled in by the same stream that produces the results. With
+    ``max_errors``, the stream is closed once that many issues have failed.
+    """
+    failed = 0
     warned = False
-    for issue in selected:
-        errors, warnings = validate_issue(issue)
+    stopped = False
+    for errors, warnings in results:
         if errors:
-            failed = True
+            failed += 1
             header, *rest = errors
-            print(f"[FAIL] {header}", file=sys.stderr)
+            print(f"[FAIL] {header}", file=out)
             for msg in rest:
-                print(f"  - {msg}", file=sys.stderr)
+                print(f"  - {msg}", file=out)
         if warnings:
             warned = True
             header, *rest = warnings
-            print(f"[WARN] {header}", file=sys.stderr)
+            print(f"[WARN] {header}", file=out)
             for msg in rest:
-                print(f"  - {msg}", file=sys.stderr)
+                print(f"  - {msg}", file=out)
+        if errors and _stop(results, max_errors, failed):
+            stopped = True
+            break
+
+    if stopped:
+        print(
+            f"[STOP] error budget of {max_errors} failing issue(s) used up; "
+            "remaining issues were not checked",
+            file=out,
+        )
+    if load_errors:
+        for err in load_errors:
+            print(f"[ERROR] {err}", file=out)
+        return 2
 
     if failed:
         print(
@@ -285,16 +1143,491 @@ def main() -> int:
             "Non-Goals / Constraints / Verification sections; "
             "Acceptance Criteria must have bullet items; "
             "Verification must contain a ```bash code block.",
-            file=sys.stderr,
+            file=out,
         )
         return 1
     if warned:
         print(
             "\nWarnings above are advisory — consider fixing for better agent executability.",
-            file=sys.stderr,
+            file=out,
         )
     return 0
 
 
+def report_ndjson(
+    results: Iterable[tuple[list[str], list[str]]],
+    ids: deque,
+    load_errors: list[str],
+    out: TextIO = sys.stdout,
+    max_errors: int = 0,
+) -> int:
+    """Emit one JSON object per checked issue as it arrives.
+
+    Passing issues get a "pass" result too, so a consumer can tell a clean
+    issue from one not reached yet without waiting for the summary.
+
+    ``ids`` is filled with issue ids in the order issues enter the stream
+    (see _tap_ids), so the n-th result pops the n-th id. Load errors are
+    emitted as soon as they show up, and a summary object ends the stream.
+    Returns the same exit code as report().
+    """
+    def emit(record: dict) -> None:
+        out.write(json.dumps(record) + "\n")
+        out.flush()
+
+    checked = failed = warned = 0
+    emitted_errors = 0
+    stopped = False
+    for errors, warnings in results:
+        checked += 1
+        issue_id = ids.popleft() if ids else ""
+        emit({
+            "type": "result",
+            "id": issue_id,
+            "status": "fail" if errors else "warn" if warnings else "pass",
+            "errors": errors[1:],
+            # Warnings carry the header only when there are no errors
+            "warnings": warnings if errors else warnings[1:],
+        })
+        failed += bool(errors)
+        warned += bool(warnings)
+        while emitted_errors < len(load_errors):
+            emit({"type": "load_error", "message": load_errors[emitted_errors]})
+            emitted_errors += 1
+        if errors and _stop(results, max_errors, failed):
+            stopped = True
+            break
+    for message in load_errors[emitted_errors:]:
+        emit({"type": "load_error", "message": message})
+
+    exit_code = 2 if load_errors else 1 if failed else 0
+    emit({
+        "type": "summary",
+        "checked": checked,
+        "failed": failed,
+        "warned": warned,
+        "load_errors": len(load_errors),
+        "stopped": stopped,
+        "exit": exit_code,
+    })
+    return exit_code
+
+
+def _tap_ids(issues: Iterable[dict], ids: deque) -> Iterator[dict]:
+    for issue in issues:
+        ids.append(str(issue.get("id", "")))
+        yield issue
+
+
+# ── Multi-target mode ───────────────────────────────────────────
+
+
+def _dir_issues(path: pathlib.Path) -> pathlib.Path:
+    """Issues file a repo directory stands for: .beads/issues.jsonl, or
+    issues.jsonl when the directory has no .beads/ but does have one."""
+    if (path / ".beads").is_dir() or not (path / "issues.jsonl").exists():
+        return path / ".beads" / "issues.jsonl"
+    return path / "issues.jsonl"
+
+
+def _expand_targets(patterns: list[str]) -> list[pathlib.Path]:
+    """Issues files named by paths or globs, in order and without duplicates.
+
+    A directory stands for its .beads/issues.jsonl, or its issues.jsonl when
+    it has no .beads/. A literal path is kept even if it does not exist, so
+    its absence is reported against it. Glob matches are kept only if they
+    are *.jsonl files or directories holding an issues file, so a hub's
+    README or a repo without a tracker is skipped rather than failing.
+    """
+    targets: dict[pathlib.Path, None] = {}
+    for pattern in patterns:
+        expanded = os.path.expanduser(pattern)
+        if not glob.has_magic(expanded):
+            path = pathlib.Path(expanded).resolve()
+            targets.setdefault(_dir_issues(path) if path.is_dir() else path, None)
+            continue
+        found = False
+        for match in sorted(glob.glob(expanded, recursive=True)):
+            path = pathlib.Path(match).resolve()
+            if path.is_dir():
+                path = _dir_issues(path)
+                if not path.is_file():
+                    continue
+            elif path.suffix != ".jsonl" or not path.is_file():
+                continue
+            targets.setdefault(path, None)
+            found = True
+        if not found:
+            print(f"[WARN] --target {pattern}: no issues files match", file=sys.stderr)
+    return list(targets)
+
+
+def _target_name(path: pathlib.Path) -> str:
+    """Repo a target belongs to: the directory holding .beads/, or the file stem."""
+    if path.name != "issues.jsonl":
+        return path.stem
+    parent = path.parent
+    return (parent.parent if parent.name == ".beads" else parent).name
+
+
+def _lint_target(path: str, status: str, rule_names: tuple[str, ...]) -> dict:
+    """Stream one issues file and return its counts; runs in a worker process."""
+    rules = tuple(RULES[name] for name in rule_names)
+    issues_path = pathlib.Path(path)
+    load_errors: list[str] = []
+    if not issues_path.is_file():
+        load_errors.append("issues file not found")
+    checked = failed = warned = 0
+    by_rule: dict[str, int] = {}
+    failing: list[str] = []
+    issues = _iter_issues(issues_path, load_errors, _status_filter(status))
+    for issue in _select_issues(issues, status):
+        checked += 1
+        findings = _evaluate(issue, rules)
+        if not findings:
+            continue
+        severities = {rule.severity for rule, _ in findings}
+        if "error" in severities:
+            failed += 1
+            if len(failing) < TARGET_SAMPLE:
+                failing.append(str(issue.get("id", "")).strip() or "<no-id>")
+        warned += "warning" in severities
+        # Gates report several messages under one rule; count the issue once
+        for name in dict.fromkeys(rule.name for rule, _ in findings):
+            by_rule[name] = by_rule.get(name, 0) + 1
+    return {
+        "repo": _target_name(issues_path),
+        "path": path,
+        "checked": checked,
+        "failed": failed,
+        "warned": warned,
+        "rules": {name: by_rule[name] for name in rule_names if name in by_rule},
+        "failing": failing,
+        "load_errors": load_errors,
+    }
+
+
+def _lint_targets(
+    targets: list[pathlib.Path], status: str, jobs: int, rules: tuple[Rule, ...]
+) -> Iterator[dict]:
+    """Lint each target, yielding its summary in target order.
+
+    With ``jobs > 1`` whole files are spread over a process pool, at most
+    ``2 * jobs`` at a time. Every worker streams its file, so memory is
+    bounded by the number of files in flight, not by their size.
+    """
+    rule_names = tuple(rule.name for rule in rules)
+    if jobs <= 1:
+        for path in targets:
+            yield _lint_target(str(path), status, rule_names)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending: deque = deque()
+        try:
+            for path in targets:
+                pending.append(pool.submit(_lint_target, str(path), status, rule_names))
+                if len(pending) >= 2 * jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def report_targets(
+    summaries: Iterable[dict], fmt: str = "text", out: TextIO | None = None
+) -> int:
+    """Print one line (or ndjson object) per target, then per-rule totals.
+
+    Returns 2 if any target had load errors, 1 if any issue failed, else 0.
+    """
+    if out is None:
+        out = sys.stdout if fmt == "ndjson" else sys.stderr
+    totals = {"targets": 0, "checked": 0, "failed": 0, "warned": 0, "load_errors": 0}
+    # rule -> [issues, repos]
+    by_rule: dict[str, list[int]] = {}
+    for summary in summaries:
+        totals["targets"] += 1
+        for key in ("checked", "failed", "warned"):
+            totals[key] += summary[key]
+        totals["load_errors"] += len(summary["load_errors"])
+        for name, count in summary["rules"].items():
+            counts = by_rule.setdefault(name, [0, 0])
+            counts[0] += count
+            counts[1] += 1
+        if fmt == "ndjson":
+            out.write(json.dumps({"type": "target", **summary}) + "\n")
+            out.flush()
+            continue
+        tag = "ERROR" if summary["load_errors"] else "FAIL" if summary["failed"] else "OK"
+        print(
+            f"[{tag}] {summary['repo']}: {summary['checked']} checked, "
+            f"{summary['failed']} failed, {summary['warned']} warned  ({summary['path']})",
+            file=out,
+        )
+        for err in summary["load_errors"]:
+            print(f"  - {err}", file=out)
+        if summary["failing"]:
+            more = summary["failed"] - len(summary["failing"])
+            print(
+                f"  - failing: {', '.join(summary['failing'])}" + (f" (+{more} more)" if more else ""),
+                file=out,
+            )
+
+    exit_code = 2 if totals["load_errors"] else 1 if totals["failed"] else 0
+    ordered = [name for name in RULES if name in by_rule]
+    if fmt == "ndjson":
+        rules = {name: {"issues": by_rule[name][0], "repos": by_rule[name][1]} for name in ordered}
+        out.write(json.dumps({"type": "summary", **totals, "rules": rules, "exit": exit_code}) + "\n")
+        return exit_code
+
+    if ordered:
+        print("\nBy rule:", file=out)
+        for name in ordered:
+            issues, repos = by_rule[name]
+            print(
+                f"  {name:<28} {RULES[name].severity:<8} {issues:>6} issue(s) in {repos} repo(s)",
+                file=out,
+            )
+    print(
+        f"\n{totals['targets']} target(s): {totals['checked']} checked, "
+        f"{totals['failed']} failed, {totals['warned']} warned",
+        file=out,
+    )
+    return exit_code
+
+
+def _ask_daemon(socket_path: pathlib.Path, request: dict) -> dict | None:
+    """Send one request to a running lint daemon; None if none answered."""
+    if not socket_path.exists():
+        return None
+    import socket
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(DAEMON_TIMEOUT)
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+        response = json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(response, dict) or not isinstance(response.get("exit"), int):
+        return None
+    return response
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Lint beads issues for scope contracts.")
+    parser.add_argument(
+        "--issues-file", default=".beads/issues.jsonl",
+        help="Path to issues JSONL (default: .beads/issues.jsonl)",
+    )
+    parser.add_argument(
+        "--target", dest="targets", action="append", metavar="PATH",
+        help="Lint this issues file, repo directory or glob instead, e.g. "
+        "'~/beads-hub/*'; globs keep only *.jsonl files and repos with an issues file "
+        "(repeatable; aggregated report, no cache or daemon)",
+    )
+    parser.add_argument(
+        "--status", choices=["open", "in_progress", "all"], default="all",
+        help="Filter by status (default: all non-closed)",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Worker processes for validation (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--cache-file", default=None,
+        help=f"Result cache path (default: {DEFAULT_CACHE_NAME} next to the issues file)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Validate every issue and leave the result cache untouched",
+    )
+    parser.add_argument(
+        "--socket", default=None,
+        help=f"Lint daemon socket (default: {DEFAULT_SOCKET_NAME} next to the issues file)",
+    )
+    parser.add_argument(
+        "--no-daemon", action="store_true",
+        help="Lint in this process even if a lint daemon is running",
+    )
+    parser.add_argument(
+        "--changed-only", action="store_true",
+        help="Only lint issues added or modified in the staged diff of the issues file",
+    )
+    parser.add_argument(
+        "--since", metavar="REV", default=None,
+        help="Only lint issues added or modified since REV (implies --changed-only)",
+    )
+    parser.add_argument(
+        "--full-scan", action="store_true",
+        help="Lint every issue even with --changed-only/--since (for CI)",
+    )
+    parser.add_argument(
+        "--id", dest="ids", action="append", metavar="ID",
+        help=f"Lint only this issue, whatever its status (repeatable; uses {DEFAULT_INDEX_NAME})",
+    )
+    parser.add_argument(
+        "--profile", nargs="?", const="table", choices=["table", "json"], default=None,
+        help="Report per-rule timings: a table on stderr (default) or JSON on stdout",
+    )
+    parser.add_argument(
+        "--profile-top", type=int, default=PROFILE_TOP, metavar="N",
+        help=f"Slowest issues listed by --profile (default: {PROFILE_TOP})",
+    )
+    parser.add_argument(
+        "--rules", default=None, metavar="NAMES",
+        help="Comma-separated rules or severities (error, warning) to run (default: all)",
+    )
+    parser.add_argument(
+        "--skip-rules", default="", metavar="NAMES",
+        help="Comma-separated rules or severities to leave out",
+    )
+    parser.add_argument(
+        "--list-rules", action="store_true", help="List the available rules and exit"
+    )
+    parser.add_argument(
+        "--max-errors", type=int, default=0, metavar="N",
+        help="Stop reading and validating after N failing issues (default: 0 = no limit)",
+    )
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="Stop at the first failing issue (--max-errors 1)"
+    )
+    parser.add_argument(
+        "--format", choices=["text", "ndjson"], default="text",
+        help="text report on stderr (default) or, on stdout, one JSON object per checked "
+        "issue (status pass, warn or fail; per target with --target) followed by a summary",
+    )
+    args = parser.parse_args(argv)
+    max_errors = 1 if args.fail_fast else max(args.max_errors, 0)
+
+    if args.list_rules:
+        for rule in ALL_RULES:
+            print(f"{rule.name:<28} {rule.severity:<8} {rule.needs}")
+        return 0
+    try:
+        rules = select_rules(
+            args.rules.split(",") if args.rules is not None else None,
+            [name for name in args.skip_rules.split(",") if name],
+        )
+    except ValueError as exc:
+        parser.error(f"{exc} — see --list-rules")
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.targets:
+        if args.changed_only or args.since or args.ids or args.profile or max_errors:
+            parser.error(
+                "--target cannot be combined with --changed-only, --since, --id, "
+                "--profile, --max-errors or --fail-fast"
+            )
+        targets = _expand_targets(args.targets)
+        return report_targets(_lint_targets(targets, args.status, jobs, rules), args.format)
+
+    issues_path = pathlib.Path(args.issues_file).expanduser().resolve()
+
+    changed = None
+    if (
+        (args.changed_only or args.since)
+        and not (args.full_scan or args.ids)
+        and issues_path.exists()
+    ):
+        # Unresolved, so a symlink into another repo is recognised as such
+        changed = _changed_issues(pathlib.Path(args.issues_file).expanduser(), args.since)
+        if changed is None:
+            print(
+                f"[WARN] cannot diff {issues_path.name} with git; linting all issues",
+                file=sys.stderr,
+            )
+
+    # The daemon always lints the whole file with every rule into a text report
+    if (
+        not args.no_daemon
+        and changed is None
+        and not args.ids
+        and not args.profile
+        and rules == ALL_RULES
+        and not max_errors
+        and args.format == "text"
+    ):
+        socket_path = (
+            pathlib.Path(args.socket).expanduser()
+            if args.socket
+            else issues_path.parent / DEFAULT_SOCKET_NAME
+        )
+        response = _ask_daemon(
+            socket_path,
+            {
+                "command": "lint",
+                "issues_file": str(issues_path),
+                "status": args.status,
+                "rules": _rules_fingerprint(),
+            },
+        )
+        if response is not None:
+            sys.stderr.write(str(response.get("output", "")))
+            return response["exit"]
+
+    cache = None
+    if not args.no_cache and issues_path.exists():
+        cache_path = (
+            pathlib.Path(args.cache_file).expanduser()
+            if args.cache_file
+            else issues_path.parent / DEFAULT_CACHE_NAME
+        )
+        cache = LintCache(cache_path, rules)
+    profile = Profile(args.profile_top) if args.profile else None
+    started = time.perf_counter()
+    load_errors: list[str] = []
+    if args.ids:
+        index = IssueIndex(issues_path, issues_path.parent / DEFAULT_INDEX_NAME)
+        selected = _read_by_id(index, args.ids, load_errors)
+    elif changed is None:
+        selected = _select_issues(
+            _iter_issues(issues_path, load_errors, _status_filter(args.status), profile),
+            args.status,
+        )
+    else:
+        lines, ids = changed
+        status_keep = _status_filter(args.status)
+        changed_keep = _changed_filter(lines, ids)
+        selected = _select_issues(
+            _iter_issues(
+                issues_path, load_errors, lambda s: status_keep(s) and changed_keep(s), profile
+            ),
+            args.status,
+            ids,
+        )
+    if args.format == "ndjson":
+        order: deque = deque()
+        results = _validate_stream(_tap_ids(selected, order), jobs, cache, profile, rules)
+        exit_code = report_ndjson(results, order, load_errors, max_errors=max_errors)
+    else:
+        results = _validate_stream(selected, jobs, cache, profile, rules)
+        exit_code = report(results, load_errors, max_errors=max_errors)
+    if cache:
+        # Only a complete full scan sees every live issue, so only it may prune
+        cache.save(
+            prune=args.status == "all" and changed is None and not args.ids and not max_errors
+        )
+    if profile is not None:
+        wall = time.perf_counter() - started
+        if args.profile == "json" and args.format == "ndjson":
+            print(json.dumps({"type": "profile", **profile.as_dict(wall)}))
+        elif args.profile == "json":
+            print(json.dumps(profile.as_dict(wall), indent=2))
+        else:
+            profile.print_table(wall)
+    return exit_code
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
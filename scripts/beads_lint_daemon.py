@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""Serve beads contract lint results from a long-running process.
+
+Keeps issues.jsonl parsed in memory, re-reads only appended or changed
+lines when the file changes, memoizes validate_issue per line, and answers
+lint requests from beads_contract_lint.py over a Unix socket. The hook
+falls back to its one-shot path whenever no daemon answers.
+
+Usage:
+  python3 scripts/beads_lint_daemon.py --issues-file .beads/issues.jsonl &
+  python3 scripts/beads_lint_daemon.py --issues-file .beads/issues.jsonl --stop
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import pathlib
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+import beads_contract_lint as lint
+from hook_common import ANCHOR_BYTES, appended_since
+
+
+class IssueFile:
+    """In-memory view of an issues JSONL file, refreshed incrementally.
+
+    Lines are kept stripped and in file order. Parse results and lint
+    results are memoized by line text, so a rewrite that only touches a
+    few lines re-parses and re-validates only those lines.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self.read_error: str | None = None
+        self._signature: tuple[int, int, int] | None = None
+        self._lines: list[str] = []
+        self._partial = ""  # last line when the file does not end in "\n"
+        self._offset = 0  # end of the last complete line
+        self._anchor = b""
+        self._parsed: dict[str, dict | tuple[str, str] | None] = {}
+        self._results: dict[str, tuple[list[str], list[str]]] = {}
+
+    def _consume(self, data: bytes) -> None:
+        end = data.rfind(b"\n") + 1
+        for raw in data[:end].split(b"\n")[:-1]:
+            self._add(raw.decode("utf-8", errors="replace").strip())
+        self._offset += end
+        self._anchor = (self._anchor + data[:end])[-ANCHOR_BYTES:]
+        self._partial = data[end:].decode("utf-8", errors="replace").strip()
+        if self._partial:
+            self._parse(self._partial)
+
+    def _parse(self, stripped: str) -> None:
+        if stripped and stripped not in self._parsed:
+            self._parsed[stripped] = lint._parse_line(stripped)
+
+    def _add(self, stripped: str) -> None:
+        self._lines.append(stripped)
+        self._parse(stripped)
+
+    def refresh(self) -> bool:
+        """Re-read the file if it changed; returns True if it did."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            changed = self._signature is not None
+            self.__init__(self.path)
+            return changed
+        except OSError as exc:
+            self.read_error = f"failed to read issues file: {exc}"
+            return True
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        if signature == self._signature:
+            return False
+
+        try:
+            with open(self.path, "rb") as f:
+                appended = appended_since(
+                    f.fileno(), stat, self._signature, self._offset, self._anchor
+                )
+                if appended:
+                    f.seek(self._offset)
+                    self._consume(f.read())
+                else:
+                    data = f.read()
+        except OSError as exc:
+            self.read_error = f"failed to read issues file: {exc}"
+            return True
+
+        if not appended:
+            parsed, results = self._parsed, self._results
+            self.__init__(self.path)
+            # Carry memoized work over for lines that did not change
+            self._parsed = parsed
+            self._consume(data)
+            live = set(self._lines) | {self._partial}
+            self._parsed = {line: parsed[line] for line in live if line in parsed}
+            self._results = {line: results[line] for line in live if line in results}
+        self.read_error = None
+        self._signature = signature
+        return True
+
+    def _result(self, stripped: str, issue: dict) -> tuple[list[str], list[str]]:
+        result = self._results.get(stripped)
+        if result is None:
+            result = self._results[stripped] = lint.validate_issue(issue)
+        return result
+
+    def lint(self, status: str) -> tuple[int, str]:
+        """Lint the current contents; returns (exit code, report text)."""
+        load_errors: list[str] = []
+        if self.read_error:
+            load_errors.append(self.read_error)
+
+        def results():
+            lines = self._lines + ([self._partial] if self._partial else [])
+            for lineno, stripped in enumerate(lines, start=1):
+                if not stripped:
+                    continue
+                parsed = self._parsed[stripped]
+                if isinstance(parsed, tuple):
+                    load_errors.append(lint._load_error(lineno, parsed))
+                elif parsed is not None and lint._status_matches(parsed, status):
+                    yield self._result(stripped, parsed)
+
+        out = io.StringIO()
+        exit_code = lint.report(results(), load_errors, out)
+        return exit_code, out.getvalue()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        response = self.server.dispatch(request if isinstance(request, dict) else {})
+        self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+class LintServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: pathlib.Path, issues: IssueFile) -> None:
+        super().__init__(str(socket_path), _Handler)
+        self.issues = issues
+        self.rules = lint._rules_fingerprint()
+        self.lock = threading.Lock()
+        self.last_request = time.monotonic()
+
+    def stop(self) -> None:
+        threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def dispatch(self, request: dict) -> dict:
+        self.last_request = time.monotonic()
+        command = request.get("command")
+        if command == "stop":
+            self.stop()
+            return {"exit": 0, "output": "lint daemon stopping\n"}
+        if command != "lint":
+            return {"error": f"unknown command: {command}"}
+        if request.get("rules") != self.rules:
+            # The lint rules changed on disk; this process is out of date
+            self.stop()
+            return {"error": "lint rules changed on disk; restart the daemon"}
+        if request.get("issues_file") != str(self.issues.path):
+            return {"error": f"daemon serves {self.issues.path}"}
+        status = request.get("status", "all")
+        with self.lock:
+            self.issues.refresh()
+            exit_code, output = self.issues.lint(status)
+        return {"exit": exit_code, "output": output}
+
+    def watch(self, interval: float, idle_timeout: float) -> None:
+        """Poll the issues file and keep results warm until shutdown."""
+        while True:
+            time.sleep(interval)
+            if idle_timeout and time.monotonic() - self.last_request > idle_timeout:
+                self.stop()
+                return
+            with self.lock:
+                if self.issues.refresh():
+                    self.issues.lint("all")
+
+
+def _in_use(socket_path: pathlib.Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve beads contract lint from memory.")
+    parser.add_argument(
+        "--issues-file", default=".beads/issues.jsonl",
+        help="Path to issues JSONL (default: .beads/issues.jsonl)",
+    )
+    parser.add_argument(
+        "--socket", default=None,
+        help=f"Socket path (default: {lint.DEFAULT_SOCKET_NAME} next to the issues file)",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=0.5,
+        help="Seconds between file checks (default: 0.5)",
+    )
+    parser.add_argument(
+        "--idle-timeout", type=float, default=0,
+        help="Exit after this many seconds without requests (default: never)",
+    )
+    parser.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    args = parser.parse_args()
+
+    issues_path = pathlib.Path(args.issues_file).expanduser().resolve()
+    socket_path = (
+        pathlib.Path(args.socket).expanduser()
+        if args.socket
+        else issues_path.parent / lint.DEFAULT_SOCKET_NAME
+    )
+
+    if args.stop:
+        response = lint._ask_daemon(socket_path, {"command": "stop"})
+        if response is None:
+            print(f"No lint daemon at {socket_path}", file=sys.stderr)
+            return 1
+        sys.stderr.write(response["output"])
+        return 0
+
+    if socket_path.exists():
+        if _in_use(socket_path):
+            print(f"[ERROR] a lint daemon is already listening on {socket_path}", file=sys.stderr)
+            return 1
+        socket_path.unlink()
+
+    issues = IssueFile(issues_path)
+    issues.refresh()
+    issues.lint("all")
+    try:
+        server = LintServer(socket_path, issues)
+    except OSError as exc:
+        print(f"[ERROR] cannot listen on {socket_path}: {exc}", file=sys.stderr)
+        return 1
+
+    signal.signal(signal.SIGTERM, lambda *_: server.stop())
+    threading.Thread(
+        target=server.watch, args=(args.interval, args.idle_timeout), daemon=True
+    ).start()
+    print(f"Lint daemon serving {issues_path} on {socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
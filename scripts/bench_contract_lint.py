@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Benchmark beads_contract_lint.validate_issue against another git revision.
+
+Generates a synthetic, template-heavy issues corpus, validates it with the
+working-tree linter and with the linter as of ``--against`` (default: HEAD),
+checks that both produce identical results and prints their timings. The
+corpus is also written out as JSONL and both revisions must select the
+same issues from it for each --status, raw-line pre-filters included.
+
+Usage: python3 scripts/bench_contract_lint.py [--issues 10000] [--against REV]
+Standalone — no external dependencies.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+SCRIPT = pathlib.Path(__file__).resolve().parent / "beads_contract_lint.py"
+
+FILLER = (
+    "The hub keeps every tracker in one place so agents can pick up work.",
+    "Context: the previous attempt drifted into refactoring unrelated modules.",
+    "See docs/plans for the design discussion and the rejected alternatives.",
+    "This paragraph exists to make descriptions long, like real issues are.",
+    "Numbers such as 42, 3.14 and v1.2.3 should not confuse the scanner.",
+)
+
+HEADINGS = {
+    "Objective": ("## Objective", "Objective:", "### objective", "# Objective"),
+    "Must-Haves": ("## Must-Haves (max 3)", "## Must Haves", "Must-Haves:"),
+    "Non-Goals": ("## Non-Goals", "## Non Goals", "Non-Goals:"),
+    "Constraints": ("## Constraints", "Constraints:", "#### Constraints"),
+    "Verification": ("## Verification", "Verification:"),
+}
+
+# Line shapes the raw-line pre-filters must not misjudge; key order matters
+EDGE_ISSUES = (
+    {"id": "edge-nested-status", "dependencies": [{"status": "closed"}], "description": "x"},
+    {"id": "edge-late-status", "dependencies": [{"status": "closed"}], "status": "open", "description": "x"},
+    {"id": "edge-brace-text", "title": "a } { [", "status": "closed", "description": "x"},
+    {"id": "edge-status-text", "title": 'the "status": "closed" field', "status": "open", "description": "x"},
+)
+
+STATUSES = ("open", "in_progress", "all")
+
+
+def _paragraph(rng: random.Random) -> list[str]:
+    return [rng.choice(FILLER) for _ in range(rng.randint(1, 6))]
+
+
+def _items(rng: random.Random, count: int, words: tuple[str, ...] = ()) -> list[str]:
+    lines = []
+    for n in range(count):
+        bullet = rng.choice(("-", "*", f"{n + 1}.", "  -"))
+        text = rng.choice(FILLER)
+        if words and rng.random() < 0.3:
+            text += f" and it {rng.choice(words)}"
+        lines.append(f"{bullet} {text}")
+    return lines
+
+
+def _section(rng: random.Random, name: str) -> list[str]:
+    lines = [rng.choice(HEADINGS[name]), ""]
+    if name == "Objective":
+        lines += _paragraph(rng)
+    elif name == "Must-Haves":
+        lines += _items(rng, rng.choice((0, 1, 2, 3, 3, 4)))
+    elif name == "Verification":
+        lines += _items(rng, rng.randint(0, 2))
+        if rng.random() < 0.8:
+            lines += ["```bash", "npm test -- --run", "task check", "```"]
+    else:
+        lines += _items(rng, rng.randint(0, 5))
+        if name == "Constraints" and rng.random() < 0.2:
+            lines.append("- Use node:latest for the build image")
+    lines.append("")
+    if rng.random() < 0.3:
+        lines += _paragraph(rng) + [""]
+    return lines
+
+
+def make_issue(rng: random.Random, index: int) -> dict:
+    """Build one synthetic issue exercising every lint rule."""
+    sections = list(HEADINGS)
+    if rng.random() < 0.1:
+        sections.remove(rng.choice(sections))
+    if rng.random() < 0.03:
+        sections.append(rng.choice(sections))
+    if rng.random() < 0.2:
+        rng.shuffle(sections)
+
+    lines = _paragraph(rng) + [""]
+    if rng.random() < 0.15:
+        lines.append("Touches ~/personal/beads-hub/ for the shared config.")
+    if rng.random() < 0.1:
+        lines.append("**Working directory:** ~/personal/beads-hub")
+    for name in sections:
+        lines += _section(rng, name)
+
+    acceptance = ""
+    vague = ("works", "is correct", "behaves as expected", "is fast")
+    if rng.random() < 0.5:
+        acceptance = "\n".join(_items(rng, rng.randint(0, 3), vague))
+    elif rng.random() < 0.7:
+        lines += ["## Acceptance Criteria", ""] + _items(rng, rng.randint(0, 3), vague)
+
+    return {
+        "id": f"bench-{index}",
+        "title": f"Synthetic issue {index}",
+        "status": rng.choice(("open", "in_progress", "closed")),
+        "description": "\n".join(lines),
+        "acceptance_criteria": acceptance,
+    }
+
+
+def make_corpus(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [make_issue(rng, i) for i in range(count)] + [dict(issue) for issue in EDGE_ISSUES]
+
+
+def _load_module(name: str, source: str, origin: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+    module.__file__ = origin
+    sys.modules[name] = module
+    exec(compile(source, origin, "exec"), module.__dict__)
+    return module
+
+
+def load_revision(rev: str) -> types.ModuleType:
+    """Import beads_contract_lint.py as it exists at git revision ``rev``."""
+    repo_root = SCRIPT.parent.parent
+    rel = SCRIPT.relative_to(repo_root).as_posix()
+    source = subprocess.run(
+        ["git", "show", f"{rev}:{rel}"],
+        capture_output=True, text=True, check=True, cwd=repo_root,
+    ).stdout
+    return _load_module("beads_contract_lint_ref", source, f"{rev}:{rel}")
+
+
+def time_validate(module: types.ModuleType, corpus: list[dict], repeat: int) -> tuple[float, list]:
+    best = float("inf")
+    results: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [module.validate_issue(issue) for issue in corpus]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def select_ids(module: types.ModuleType, path: pathlib.Path, status: str) -> list[str] | None:
+    """Ids the module streams from path for --status; None if it predates _select_issues."""
+    if not hasattr(module, "_select_issues"):
+        return None
+    errors: list[str] = []
+    if hasattr(module, "_status_filter"):
+        issues = module._iter_issues(path, errors, module._status_filter(status))
+    else:
+        issues = module._iter_issues(path, errors)
+    return [str(issue.get("id", "")) for issue in module._select_issues(issues, status)] + errors
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark validate_issue across revisions.")
+    parser.add_argument("--issues", type=int, default=10_000, help="Corpus size (default: 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus RNG seed (default: 0)")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of repeats (default: 3)")
+    parser.add_argument(
+        "--against", default="HEAD",
+        help="Git revision to compare with (default: HEAD); 'none' to skip",
+    )
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.issues, args.seed)
+    current = _load_module("beads_contract_lint", SCRIPT.read_text(encoding="utf-8"), str(SCRIPT))
+    cur_time, cur_results = time_validate(current, corpus, args.repeat)
+    print(f"corpus: {len(corpus)} issues (seed {args.seed}), best of {args.repeat}")
+    print(f"  working tree  {cur_time * 1000:9.1f} ms  {cur_time / len(corpus) * 1e6:7.1f} µs/issue")
+
+    if args.against == "none":
+        return 0
+    try:
+        reference = load_revision(args.against)
+    except subprocess.CalledProcessError as exc:
+        print(f"[ERROR] cannot load {args.against}: {exc.stderr.strip()}", file=sys.stderr)
+        return 2
+    ref_time, ref_results = time_validate(reference, corpus, args.repeat)
+    print(f"  {args.against:<12}  {ref_time * 1000:9.1f} ms  {ref_time / len(corpus) * 1e6:7.1f} µs/issue")
+    print(f"  speedup       {ref_time / cur_time:9.2f}x")
+
+    mismatches = [
+        issue["id"] for issue, a, b in zip(corpus, cur_results, ref_results) if a != b
+    ]
+    if mismatches:
+        print(
+            f"[FAIL] {len(mismatches)} issue(s) lint differently from {args.against}: "
+            + ", ".join(mismatches[:10]),
+            file=sys.stderr,
+        )
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(tmp) / "issues.jsonl"
+        path.write_text("".join(json.dumps(issue) + "\n" for issue in corpus), encoding="utf-8")
+        for status in STATUSES:
+            ref_ids = select_ids(reference, path, status)
+            if ref_ids is None:
+                print(f"  {args.against} cannot stream issues; selection not compared")
+                break
+            cur_ids = select_ids(current, path, status)
+            if cur_ids != ref_ids:
+                differ = sorted(set(cur_ids).symmetric_difference(ref_ids))
+                print(
+                    f"[FAIL] --status {status} selects different issues from {args.against}: "
+                    + ", ".join(differ[:10]),
+                    file=sys.stderr,
+                )
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
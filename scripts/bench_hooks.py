@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""Benchmark the Python hook scripts and flag performance regressions.
+
+Builds a throwaway repo with synthetic inputs (issues.jsonl, problems.jsonl,
+commit messages, an untracked file tree), copies the hook scripts into it
+and runs each hook as a subprocess. For every scenario it records median
+wall time, peak RSS and bare interpreter+import startup time.
+
+Usage:
+  python3 scripts/bench_hooks.py --output bench.json
+  python3 scripts/bench_hooks.py --baseline bench.json   # exit 1 on regression
+
+Thresholds live in scripts/bench_thresholds.json. Standalone — no external
+dependencies.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_contract_lint import make_corpus
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_THRESHOLDS = SCRIPTS_DIR / "bench_thresholds.json"
+
+HOOK_SCRIPTS = (
+    "beads_contract_lint.py",
+    "commit_msg_lint.py",
+    "observer_record.py",
+    "observer_close_hook.py",
+    "observer_query.py",
+    "hook_common.py",
+    "hook_runner.py",
+)
+
+SCALES = {
+    # issues, problems, untracked files
+    "small": (2_000, 5_000, 200),
+    "default": (20_000, 50_000, 2_000),
+    "large": (200_000, 500_000, 20_000),
+}
+
+CATEGORIES = ("build-artifact", "scope-drift", "missing-test", "flaky-check")
+SEVERITIES = ("low", "medium", "high", "critical")
+
+COMMIT_MESSAGE = """feat: add incremental lint cache
+
+Goal: stop re-validating unchanged issues on every commit.
+Why: the hook is always_run and re-checks every non-closed issue.
+How: cache results by content hash.
+"""
+
+
+# ── Corpus generators ───────────────────────────────────────────
+
+
+def write_issues(path: Path, count: int, seed: int) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for issue in make_corpus(count, seed):
+            f.write(json.dumps(issue) + "\n")
+
+
+def write_problems(path: Path, count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    with open(path, "w", encoding="utf-8") as f:
+        for n in range(count):
+            timestamp = now - datetime.timedelta(minutes=rng.randint(0, 60 * 24 * 90))
+            record = {
+                "id": f"obs-{n:06x}",
+                "timestamp": timestamp.isoformat(),
+                "issue_id": f"bd-{rng.randint(0, 500)}",
+                "category": rng.choice(CATEGORIES),
+                "severity": rng.choice(SEVERITIES),
+                "detection_method": "post-hoc-fix",
+                "summary": f"Synthetic problem {n} " + "x" * rng.randint(20, 200),
+                "verified": True,
+                "resolution_reason": "real_fix",
+            }
+            f.write(json.dumps(record) + "\n")
+
+
+def _elf_header(rng: random.Random) -> bytes:
+    head = bytearray(rng.randbytes(4096))
+    head[:20] = b"\x7fELF\x02\x01\x01" + bytes(9) + b"\x02\x00\x3e\x00"
+    return bytes(head)
+
+
+def write_untracked_tree(root: Path, count: int, seed: int) -> None:
+    """Mostly text build outputs, with ELF binaries and opaque data mixed in.
+
+    Every tenth file sits at the top level: `git status` collapses a new
+    directory into one entry, so only those are listed file by file.
+    """
+    rng = random.Random(seed)
+    for n in range(count):
+        directory = root if n % 10 == 0 else root / "out" / f"d{n % 50:02d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        kind = rng.random()
+        if kind < 0.05:
+            (directory / f"bin{n}").write_bytes(_elf_header(rng))
+        elif kind < 0.08:
+            (directory / f"blob{n}.dat").write_bytes(rng.randbytes(2048))
+        else:
+            (directory / f"gen{n}.js").write_text(f"export const v{n} = {n};\n" * 20)
+
+
+def build_workspace(root: Path, scale: str, seed: int) -> None:
+    issues, problems, untracked = SCALES[scale]
+    scripts = root / "scripts"
+    scripts.mkdir(parents=True)
+    for name in HOOK_SCRIPTS:
+        shutil.copy2(SCRIPTS_DIR / name, scripts / name)
+    observer_dir = root / ".beads" / "observer"
+    observer_dir.mkdir(parents=True)
+    (observer_dir / "taxonomy.json").write_text(
+        json.dumps({"categories": {name: {} for name in CATEGORIES}})
+    )
+    write_issues(root / ".beads" / "issues.jsonl", issues, seed)
+    write_problems(observer_dir / "problems.jsonl", problems, seed)
+    (root / "COMMIT_EDITMSG").write_text(COMMIT_MESSAGE)
+
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    (root / ".gitignore").write_text("/.beads/\n/scripts/\n/COMMIT_EDITMSG\n")
+    write_untracked_tree(root, untracked, seed)
+
+
+# ── Measurement ─────────────────────────────────────────────────
+
+
+def measure(cmd: list[str], cwd: Path) -> tuple[float, int, int]:
+    """Run cmd once; returns (wall ms, peak RSS KiB, exit code)."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall_ms = (time.perf_counter() - start) * 1000
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    rss_kb = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return wall_ms, rss_kb, proc.returncode
+
+
+def scenarios(root: Path) -> dict[str, tuple[str, list[str], list[str] | None]]:
+    """name -> (module imported for startup, argv, warm-up argv or None)."""
+    py = sys.executable
+    lint = [py, "scripts/beads_contract_lint.py", "--no-daemon"]
+    query = [py, "scripts/observer_query.py", "count", "--severity", "critical", "--since", "7d"]
+    return {
+        "contract_lint": ("beads_contract_lint", lint + ["--no-cache"], None),
+        "contract_lint_cached": ("beads_contract_lint", lint, lint),
+        "commit_msg_lint": (
+            "commit_msg_lint", [py, "scripts/commit_msg_lint.py", "COMMIT_EDITMSG"], None,
+        ),
+        "observer_record": (
+            "observer_record",
+            [
+                py, "scripts/observer_record.py", "--issue-id", "bench",
+                "--category", "scope-drift", "--severity", "low",
+                "--detection-method", "lint-failure", "--summary", "bench run",
+            ],
+            None,
+        ),
+        "observer_query": ("observer_query", query, query),
+        "observer_close_hook": ("observer_close_hook", [py, "scripts/observer_close_hook.py"], None),
+        "hook_runner": (
+            "hook_runner",
+            [
+                py, "scripts/hook_runner.py", "run",
+                "contract-lint", "--no-daemon", "commit-msg", "COMMIT_EDITMSG", "check-artifacts",
+            ],
+            None,
+        ),
+    }
+
+
+# Scenario -> text its stderr must contain, proving it did real work
+EXPECTED_STDERR = {
+    "observer_close_hook": "untracked binary",
+}
+
+
+def check_scenario(name: str, cmd: list[str], root: Path) -> str | None:
+    """Run cmd once more and return a problem if it did not do its job."""
+    expected = EXPECTED_STDERR.get(name)
+    if expected is None:
+        return None
+    proc = subprocess.run(cmd, cwd=root, capture_output=True, text=True, errors="replace")
+    if expected not in proc.stderr:
+        return f"{name}: stderr never mentions '{expected}'; the scenario timed a no-op"
+    return None
+
+
+def run_suite(root: Path, repeat: int, only: set[str] | None) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+    interpreter = [
+        measure([sys.executable, "-c", "pass"], root)[0] for _ in range(repeat)
+    ]
+    results["interpreter"] = {"startup_ms": round(statistics.median(interpreter), 2)}
+    print(f"  {'interpreter':<22} startup {results['interpreter']['startup_ms']:>6.1f} ms", file=sys.stderr)
+
+    for name, (module, cmd, warmup) in scenarios(root).items():
+        if only and name not in only:
+            continue
+        if warmup:
+            measure(warmup, root)
+        startup = [
+            measure([sys.executable, "-c", f"import {module}"], root / "scripts")[0]
+            for _ in range(repeat)
+        ]
+        runs = [measure(cmd, root) for _ in range(repeat)]
+        walls = [wall for wall, _, _ in runs]
+        results[name] = {
+            "wall_ms": round(statistics.median(walls), 2),
+            "wall_ms_min": round(min(walls), 2),
+            "peak_rss_kb": max(rss for _, rss, _ in runs),
+            "startup_ms": round(statistics.median(startup), 2),
+            "exit_codes": sorted({code for _, _, code in runs}),
+        }
+        problem = check_scenario(name, cmd, root)
+        if problem:
+            results[name]["valid"] = False
+            print(f"[ERROR] {problem}", file=sys.stderr)
+        print(
+            f"  {name:<22} {results[name]['wall_ms']:>9.1f} ms"
+            f"  {results[name]['peak_rss_kb'] / 1024:>7.1f} MiB"
+            f"  startup {results[name]['startup_ms']:>6.1f} ms",
+            file=sys.stderr,
+        )
+    return results
+
+
+# ── Regression check ────────────────────────────────────────────
+
+
+def compare(current: dict, baseline: dict, thresholds: dict) -> list[str]:
+    """Return one message per metric that regressed past its threshold.
+
+    A metric regresses when current > baseline * ratio + slack. Per-scenario
+    entries under "scenarios" override the "default" ratios and slacks.
+    """
+    regressions = []
+    for name, metrics in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        limits = {**thresholds.get("default", {}), **thresholds.get("scenarios", {}).get(name, {})}
+        for metric, value in metrics.items():
+            limit = limits.get(metric)
+            if not isinstance(limit, dict) or metric not in base:
+                continue
+            allowed = base[metric] * limit.get("ratio", 1.0) + limit.get("slack", 0)
+            if value > allowed:
+                regressions.append(
+                    f"{name}.{metric}: {value} > {allowed:.1f} (baseline {base[metric]})"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Python hook scripts.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="default")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus RNG seed (default: 0)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario (default: 5)")
+    parser.add_argument("--only", action="append", help="Run only this scenario (repeatable)")
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--baseline", help="Results JSON to compare against")
+    parser.add_argument(
+        "--thresholds", default=str(DEFAULT_THRESHOLDS),
+        help="Regression thresholds JSON (default: scripts/bench_thresholds.json)",
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the generated workspace")
+    args = parser.parse_args()
+
+    root = Path(tempfile.mkdtemp(prefix="bench-hooks-"))
+    try:
+        print(f"Generating {args.scale} corpus in {root}", file=sys.stderr)
+        build_workspace(root, args.scale, args.seed)
+        results = run_suite(root, args.repeat, set(args.only) if args.only else None)
+    finally:
+        if args.keep:
+            print(f"Workspace kept at {root}", file=sys.stderr)
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+
+    current = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": args.scale,
+            "sizes": dict(zip(("issues", "problems", "untracked"), SCALES[args.scale])),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2) + "\n")
+    if any(metrics.get("valid") is False for metrics in results.values()):
+        return 2
+
+    if not args.baseline:
+        return 0
+    try:
+        baseline = json.loads(Path(args.baseline).read_text())
+        thresholds = json.loads(Path(args.thresholds).read_text())
+    except (OSError, ValueError) as exc:
+        print(f"[ERROR] cannot load baseline/thresholds: {exc}", file=sys.stderr)
+        return 2
+    if baseline.get("meta", {}).get("scale") != args.scale:
+        print("[WARN] baseline was recorded at a different --scale", file=sys.stderr)
+    regressions = compare(current, baseline, thresholds)
+    for message in regressions:
+        print(f"[FAIL] {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
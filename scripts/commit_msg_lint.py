@@ -10,17 +10,35 @@ Format:
 
 Types: feat, fix, refactor, docs, test, chore, infra
 "Why" is mandatory for feat/fix/refactor. Optional for docs/test/chore/infra.
+
+Client side it runs as the commit-msg hook on .git/COMMIT_EDITMSG. On the
+shared remote, install it as a pre-receive hook
+(`commit_msg_lint.py --pre-receive`) or update hook
+(`commit_msg_lint.py --update "$@"`) to reject pushes whose new commits
+break the format, whether or not the client ran its hooks.
 """
 from __future__ import annotations
 
+import argparse
+import itertools
+import os
 import pathlib
 import re
+import subprocess
 import sys
+from collections import deque
+from collections.abc import Iterable, Iterator
 
 VALID_TYPES = {"feat", "fix", "refactor", "docs", "test", "chore", "infra"}
 TYPES_REQUIRING_WHY = {"feat", "fix", "refactor"}
 TYPE_RE = re.compile(r"^(?P<type>[a-z]+):\s+.+")
 
+# Commits per work unit handed to a --jobs worker process
+CHUNK_SIZE = 4096
+
+# Bytes read from `git log` per pipe read
+READ_SIZE = 1 << 16
+
 
 def lint_commit_msg(msg: str) -> list[str]:
     errors: list[str] = []
@@ -54,13 +72,219 @@ def lint_commit_msg(msg: str) -> list[str]:
     return errors
 
 
-def main() -> int:
-    # When called as commit-msg hook, first arg is the message file
-    if len(sys.argv) > 1:
-        msg_file = pathlib.Path(sys.argv[1])
-    else:
-        # Default git commit message file
-        msg_file = pathlib.Path(".git/COMMIT_EDITMSG")
+def _format_hint() -> str:
+    return (
+        "\nExpected format:\n"
+        "  <type>: <subject>\n"
+        "  \n"
+        "  Goal: what we wanted to achieve\n"
+        "  Why: why this change matters\n"
+        f"\nTypes: {', '.join(sorted(VALID_TYPES))}"
+    )
+
+
+def iter_range(rev_range: str, merges: bool = False) -> Iterator[tuple[str, str]]:
+    """Stream (sha, message) pairs for rev_range from a single `git log -z`.
+
+    Raises RuntimeError if git fails, e.g. for an unknown revision.
+    """
+    cmd = ["git", "log", "-z", "--format=%H%n%B"]
+    if not merges:
+        cmd.append("--no-merges")
+    cmd += [rev_range, "--"]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        pending = b""
+        while chunk := proc.stdout.read(READ_SIZE):
+            *entries, pending = (pending + chunk).split(b"\0")
+            for entry in entries:
+                sha, _, message = entry.decode("utf-8", errors="replace").partition("\n")
+                yield sha, message
+        if pending.strip():
+            sha, _, message = pending.decode("utf-8", errors="replace").partition("\n")
+            yield sha, message
+        stderr = proc.stderr.read()
+        if proc.wait() != 0:
+            raise RuntimeError(stderr.decode("utf-8", errors="replace").strip())
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+
+
+def _lint_chunk(chunk: list[tuple[str, str]]) -> list[list[str]]:
+    return [lint_commit_msg(message) for _, message in chunk]
+
+
+def lint_range(
+    commits: Iterable[tuple[str, str]], jobs: int = 1
+) -> Iterator[tuple[str, str, list[str]]]:
+    """Yield (sha, subject, errors) per commit, in input order.
+
+    With ``jobs > 1`` commits are linted by a process pool in chunks; at
+    most ``2 * jobs`` chunks are in flight, so memory stays bounded.
+    """
+    if jobs <= 1:
+        for sha, message in commits:
+            yield sha, message.strip().partition("\n")[0], lint_commit_msg(message)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    iterator = iter(commits)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending: deque = deque()
+        while True:
+            chunk = list(itertools.islice(iterator, CHUNK_SIZE))
+            if chunk:
+                pending.append((chunk, pool.submit(_lint_chunk, chunk)))
+            if pending and (not chunk or len(pending) >= 2 * jobs):
+                done, future = pending.popleft()
+                for (sha, message), errors in zip(done, future.result()):
+                    yield sha, message.strip().partition("\n")[0], errors
+            elif not chunk:
+                return
+
+
+def iter_new_commits(tips: list[str], merges: bool = False) -> Iterator[tuple[str, str]]:
+    """Stream (sha, message) for commits reachable from tips but from no ref.
+
+    `git rev-list` pipes its shas straight into one `git cat-file --batch`,
+    so a push costs two git processes however many commits it carries. In
+    a pre-receive or update hook the refs are not moved yet, so this is
+    exactly the pushed commits. Raises RuntimeError if git fails.
+    """
+    cmd = ["git", "rev-list"]
+    if not merges:
+        cmd.append("--no-merges")
+    cmd += [*tips, "--not", "--all"]
+    rev_list = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    cat_file = subprocess.Popen(
+        ["git", "cat-file", "--batch"],
+        stdin=rev_list.stdout,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    # cat-file holds the only read end now, so rev-list sees EPIPE if it dies
+    rev_list.stdout.close()
+    try:
+        out = cat_file.stdout
+        while header := out.readline():
+            # "<sha> <type> <size>\n<content>\n", or "<sha> missing\n"
+            parts = header.split()
+            if len(parts) != 3:
+                raise RuntimeError(f"cat-file: {header.decode('utf-8', errors='replace').strip()}")
+            sha, kind, size = parts
+            content = out.read(int(size))
+            out.read(1)
+            if kind == b"commit":
+                _, _, message = content.partition(b"\n\n")
+                yield sha.decode("ascii"), message.decode("utf-8", errors="replace")
+        for proc, name in ((rev_list, "rev-list"), (cat_file, "cat-file")):
+            stderr = proc.stderr.read()
+            if proc.wait() != 0:
+                raise RuntimeError(f"{name}: {stderr.decode('utf-8', errors='replace').strip()}")
+    finally:
+        for proc in (rev_list, cat_file):
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+        cat_file.stdout.close()
+        for proc in (rev_list, cat_file):
+            proc.stderr.close()
+
+
+def read_ref_updates(lines: Iterable[str]) -> list[tuple[str, str, str]]:
+    """Parse pre-receive input: one "<old> <new> <ref>" line per updated ref."""
+    updates = []
+    for line in lines:
+        fields = line.split()
+        if len(fields) == 3:
+            updates.append((fields[0], fields[1], fields[2]))
+    return updates
+
+
+def _report_commits(
+    commits: Iterable[tuple[str, str]], jobs: int, verbose: bool, source: str
+) -> int:
+    checked = failed = 0
+    try:
+        for sha, subject, errors in lint_range(commits, jobs):
+            checked += 1
+            if errors:
+                failed += 1
+                print(f"[FAIL] {sha[:12]} {subject}", file=sys.stderr)
+                for err in errors:
+                    print(f"  - {err}", file=sys.stderr)
+            elif verbose:
+                print(f"[OK]   {sha[:12]} {subject}", file=sys.stderr)
+    except RuntimeError as exc:
+        print(f"[ERROR] {source}: {exc}", file=sys.stderr)
+        return 2
+
+    print(f"\n{checked} commit(s) checked, {failed} failed", file=sys.stderr)
+    if failed:
+        print(_format_hint(), file=sys.stderr)
+        return 1
+    return 0
+
+
+def _main_range(rev_range: str, merges: bool, jobs: int, verbose: bool) -> int:
+    return _report_commits(iter_range(rev_range, merges), jobs, verbose, f"git log {rev_range}")
+
+
+def _main_push(updates: list[tuple[str, str, str]], merges: bool, jobs: int, verbose: bool) -> int:
+    # A new sha of all zeros deletes the ref; there is nothing to lint
+    tips = list(dict.fromkeys(new for _, new, _ in updates if new.strip("0")))
+    if not tips:
+        return 0
+    return _report_commits(iter_new_commits(tips, merges), jobs, verbose, "pushed commits")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Lint commit messages.")
+    parser.add_argument(
+        "msg_file", nargs="?", default=".git/COMMIT_EDITMSG",
+        help="Commit message file (default: .git/COMMIT_EDITMSG)",
+    )
+    parser.add_argument(
+        "--range", dest="rev_range", metavar="A..B",
+        help="Lint every commit in this git revision range instead of a message file",
+    )
+    parser.add_argument(
+        "--pre-receive", action="store_true",
+        help="Server-side pre-receive hook: lint the commits of the ref updates on stdin",
+    )
+    parser.add_argument(
+        "--update", nargs=3, metavar=("REF", "OLD", "NEW"),
+        help="Server-side update hook: lint the commits this ref update adds",
+    )
+    parser.add_argument(
+        "--include-merges", action="store_true", help="With --range or a push, also lint merge commits"
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="With --range or a push, worker processes (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--verbose", "-v", action="store_true",
+        help="With --range or a push, also list passing commits",
+    )
+    args = parser.parse_args(argv)
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.rev_range:
+        return _main_range(args.rev_range, args.include_merges, jobs, args.verbose)
+    if args.pre_receive:
+        return _main_push(read_ref_updates(sys.stdin), args.include_merges, jobs, args.verbose)
+    if args.update:
+        ref, old, new = args.update
+        return _main_push([(old, new, ref)], args.include_merges, jobs, args.verbose)
+
+    # When called as commit-msg hook, the argument is the message file
+    msg_file = pathlib.Path(args.msg_file)
 
     if not msg_file.exists():
         # No message to lint (might be running outside commit-msg hook)
@@ -80,15 +304,7 @@ def main() -> int:
         print("[COMMIT MSG]", file=sys.stderr)
         for err in errors:
             print(f"  - {err}", file=sys.stderr)
-        print(
-            "\nExpected format:\n"
-            "  <type>: <subject>\n"
-            "  \n"
-            "  Goal: what we wanted to achieve\n"
-            "  Why: why this change matters\n"
-            f"\nTypes: {', '.join(sorted(VALID_TYPES))}",
-            file=sys.stderr,
-        )
+        print(_format_hint(), file=sys.stderr)
         return 1
     return 0
 
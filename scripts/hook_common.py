@@ -0,0 +1,92 @@
+"""Repo-root discovery, taxonomy loading, atomic writes and append-only
+change detection shared by the hook scripts.
+
+Imported by beads_contract_lint.py, the observer_*.py scripts and
+hook_runner.py. Standalone — no external dependencies.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Sequence
+from pathlib import Path
+
+# Bytes before a consumed offset that must be unchanged for a tail-only read
+ANCHOR_BYTES = 256
+
+# taxonomy.json path -> ((size, mtime_ns), parsed taxonomy)
+_TAXONOMIES: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def find_repo_root(start: Path) -> Path | None:
+    """Walk up from start until a directory containing .beads/ is found."""
+    current = start.resolve()
+    while current != current.parent:
+        if (current / ".beads").is_dir():
+            return current
+        current = current.parent
+    return None
+
+
+def write_atomic(path: Path, data: bytes | str, durable: bool = False) -> None:
+    """Replace path with data through a temp file and os.replace.
+
+    Readers see the old or the new contents, never a partial write. With
+    ``durable`` the data is fsynced before the rename. Raises OSError; the
+    temp file is removed either way.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def read_anchor(fd: int, offset: int) -> bytes:
+    """The up to ANCHOR_BYTES bytes just before offset in fd."""
+    start = max(0, offset - ANCHOR_BYTES)
+    return os.pread(fd, offset - start, start)
+
+
+def appended_since(
+    fd: int, st: os.stat_result, previous: Sequence[int] | None, offset: int, anchor: bytes
+) -> bool:
+    """True if fd is the file last read with only bytes appended since.
+
+    ``previous`` is the (inode, size, ...) signature taken at that read,
+    ``offset`` the end of what was consumed and ``anchor`` the bytes just
+    before it (see read_anchor); ``st`` is the current stat of fd. Anything
+    else (a new inode, a shrink, an in-place rewrite) means a full re-read.
+    """
+    if previous is None or st.st_ino != previous[0]:
+        return False
+    # Same size but a new mtime means it was rewritten in place
+    if st.st_size <= previous[1] or st.st_size < offset:
+        return False
+    return read_anchor(fd, offset) == anchor
+
+
+def load_taxonomy(repo_root: Path) -> dict:
+    """Load taxonomy.json; raises OSError or ValueError if unusable.
+
+    The parsed file is memoized while its size and mtime are unchanged, so
+    hooks sharing one interpreter parse it once.
+    """
+    taxonomy_path = repo_root / ".beads" / "observer" / "taxonomy.json"
+    st = os.stat(taxonomy_path)
+    signature = (st.st_size, st.st_mtime_ns)
+    cached = _TAXONOMIES.get(taxonomy_path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    with open(taxonomy_path) as f:
+        taxonomy = json.load(f)
+    _TAXONOMIES[taxonomy_path] = (signature, taxonomy)
+    return taxonomy
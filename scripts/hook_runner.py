@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Run several Python hooks in one interpreter.
+
+Hook modules are imported on first use, so a run pays interpreter startup
+once and only the named hooks compile their regexes. Hooks share repo-root
+discovery and the parsed taxonomy through hook_common. Arguments after a
+hook name, up to the next hook name, are passed to that hook's main().
+
+Usage:
+  python3 scripts/hook_runner.py run contract-lint --changed-only check-artifacts
+  python3 scripts/hook_runner.py run commit-msg .git/COMMIT_EDITMSG
+  python3 scripts/hook_runner.py list
+
+Every hook runs even if an earlier one fails; the exit code is the highest
+one returned. Standalone — no external dependencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import time
+import traceback
+
+# Hook name -> module whose main(argv) runs it
+HOOKS = {
+    "contract-lint": "beads_contract_lint",
+    "commit-msg": "commit_msg_lint",
+    "check-artifacts": "observer_close_hook",
+}
+
+
+def split_invocations(tokens: list[str]) -> list[tuple[str, list[str]]]:
+    """Group tokens into (hook, args) pairs; raises ValueError on a leading non-hook."""
+    invocations: list[tuple[str, list[str]]] = []
+    for token in tokens:
+        if token in HOOKS:
+            invocations.append((token, []))
+        elif invocations:
+            invocations[-1][1].append(token)
+        else:
+            raise ValueError(f"unknown hook '{token}' — valid: {', '.join(HOOKS)}")
+    return invocations
+
+
+def run_hook(name: str, args: list[str]) -> tuple[int, float, float]:
+    """Import and run one hook; returns (exit code, import ms, run ms).
+
+    A hook that fails to import counts as that hook failing with exit 1.
+    """
+    start = time.perf_counter()
+    imported = None
+    try:
+        module = importlib.import_module(HOOKS[name])
+        imported = time.perf_counter()
+        code = module.main(args)
+    except SystemExit as exc:
+        code = exc.code
+    except Exception:
+        traceback.print_exc()
+        code = 1
+    finished = time.perf_counter()
+    if imported is None:
+        # The import itself failed; count all of it as import time
+        imported = finished
+
+    if code is None:
+        code = 0
+    elif not isinstance(code, int):
+        print(code, file=sys.stderr)
+        code = 1
+    return code, (imported - start) * 1000, (finished - imported) * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run Python hooks in one interpreter")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="Run hooks in order")
+    run.add_argument("hooks", nargs=argparse.REMAINDER, help="HOOK [ARGS...] [HOOK [ARGS...]]...")
+    commands.add_parser("list", help="List available hooks")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for name, module in HOOKS.items():
+            print(f"{name:<16} scripts/{module}.py")
+        return 0
+
+    try:
+        invocations = split_invocations(args.hooks)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if not invocations:
+        parser.error("no hooks given")
+
+    exit_code = 0
+    total = 0.0
+    for name, hook_args in invocations:
+        code, import_ms, run_ms = run_hook(name, hook_args)
+        total += import_ms + run_ms
+        exit_code = max(exit_code, code)
+        print(
+            f"[HOOK] {name}: exit {code} in {import_ms + run_ms:.1f} ms "
+            f"(import {import_ms:.1f} ms)",
+            file=sys.stderr,
+        )
+    if len(invocations) > 1:
+        print(f"[HOOK] total: {total:.1f} ms", file=sys.stderr)
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,128 +2,588 @@
 """Detect untracked binary artifacts in the repo.
 
 Usage: task observer:check-artifacts
-Or run directly: python3 scripts/observer_close_hook.py
-Advisory only — always exits 0, never blocks.
+Or run directly: python3 scripts/observer_close_hook.py [--budget-ms 5000]
+Untracked directories, which git reports as one entry, are walked for the
+files inside them. Advisory only — always exits 0, never blocks. Files not
+scanned before the time budget runs out are listed instead.
 """
 
+import argparse
+import fnmatch
+import json
+import os
+import re
+import selectors
+import stat
+import struct
 import subprocess
 import sys
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
 from pathlib import Path
 
+from hook_common import find_repo_root, write_atomic
+
+try:
+    import observer_record
+except ImportError:
+    observer_record = None
+
 BINARY_KEYWORDS = ("ELF", "Mach-O", "PE32", "executable", "shared object")
 
+# Bytes read per file for in-process magic sniffing
+SNIFF_BYTES = 4096
 
-def find_repo_root(start: Path) -> Path | None:
-    """Walk up from start until a directory containing .beads/ is found."""
-    current = start.resolve()
-    while current != current.parent:
-        if (current / ".beads").is_dir():
-            return current
-        current = current.parent
-    return None
+# Paths per `file` invocation, well below any ARG_MAX
+FILE_BATCH_SIZE = 256
 
+MACHO_MAGICS = {
+    b"\xfe\xed\xfa\xce": (">", "32-bit"),
+    b"\xce\xfa\xed\xfe": ("<", "32-bit"),
+    b"\xfe\xed\xfa\xcf": (">", "64-bit"),
+    b"\xcf\xfa\xed\xfe": ("<", "64-bit"),
+}
+MACHO_FILETYPES = {1: "object", 2: "executable", 6: "dynamically linked shared library", 8: "bundle"}
+ELF_TYPES = {1: "relocatable", 2: "executable", 3: "shared object", 4: "core file"}
 
-def get_untracked_files(repo_root: Path) -> list[str]:
-    """Return list of untracked file paths from git status --porcelain."""
-    try:
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            cwd=repo_root,
-        )
-    except FileNotFoundError:
-        print("Warning: git not found, skipping artifact check", file=sys.stderr)
-        return []
+# Threads running `file` batches, and so batches in flight at once
+DEFAULT_JOBS = 4
 
-    files = []
-    for line in result.stdout.splitlines():
-        if line.startswith("?? "):
-            files.append(line[3:].strip())
-    return files
+# Wall-clock limit for the whole scan; 0 disables it
+DEFAULT_BUDGET_MS = 5000
 
+# Binaries per record_many call while the scan is still running
+RECORD_BATCH_SIZE = 64
 
-def is_binary(filepath: Path) -> tuple[bool, str]:
-    """Check if a file is a binary using the file command. Returns (is_binary, file_type)."""
-    try:
-        result = subprocess.run(
-            ["file", str(filepath)],
-            capture_output=True,
-            text=True,
+# Unscanned paths listed when the budget runs out
+UNSCANNED_SHOWN = 20
+
+# Files below this size cannot hold an ELF, Mach-O or PE header; skipped unread
+DEFAULT_MIN_BYTES = 28
+
+# Levels below an untracked directory that are still walked
+DEFAULT_MAX_DEPTH = 8
+
+# Names never walked into or classified inside untracked directories
+DEFAULT_IGNORE = (".git", "node_modules", "__pycache__", ".venv", "venv", ".tox", ".*_cache")
+
+# Bytes read from `git status` per read
+READ_SIZE = 64 * 1024
+
+# Scan result cache in .beads/observer/; bump CACHE_VERSION if its layout changes
+CACHE_NAME = "artifacts.cache.json"
+CACHE_VERSION = 1
+
+
+class UntrackedStream:
+    """Untracked paths from `git status --porcelain -z`, yielded as git emits them.
+
+    Iteration stops quietly once ``deadline`` (a time.monotonic() value)
+    passes; ``complete`` tells whether all of git's output was read.
+    """
+
+    def __init__(self, repo_root: Path, deadline: float | None = None) -> None:
+        self.repo_root = repo_root
+        self.deadline = deadline
+        self.complete = False
+
+    def __iter__(self) -> Iterator[str]:
+        try:
+            proc = subprocess.Popen(
+                ["git", "status", "--porcelain", "-z"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.repo_root,
+            )
+        except FileNotFoundError:
+            print("Warning: git not found, skipping artifact check", file=sys.stderr)
+            self.complete = True
+            return
+
+        fd = proc.stdout.fileno()
+        pending = b""
+        origin_follows = False
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(fd, selectors.EVENT_READ)
+                while True:
+                    if self.deadline is not None:
+                        remaining = self.deadline - time.monotonic()
+                        if remaining <= 0 or not selector.select(remaining):
+                            return
+                    chunk = os.read(fd, READ_SIZE)
+                    if not chunk:
+                        break
+                    *entries, pending = (pending + chunk).split(b"\0")
+                    for entry in entries:
+                        # Renames and copies carry their origin path as an extra field
+                        if origin_follows:
+                            origin_follows = False
+                            continue
+                        if entry[:1] in (b"R", b"C"):
+                            origin_follows = True
+                        elif entry.startswith(b"?? "):
+                            yield os.fsdecode(entry[3:])
+            self.complete = True
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+            proc.stdout.close()
+
+
+class UntrackedWalker:
+    """Expand untracked directories into the files below them.
+
+    `git status` lists a new directory as a single "dir/" entry. Those are
+    walked breadth first with os.scandir on ``jobs`` threads, at most
+    ``2 * jobs`` directories being read at once; other names pass through.
+    Entries matching an ignore pattern are skipped, symlinks are not
+    followed, and directories more than ``max_depth`` levels down are not
+    entered but counted in ``pruned``. Directories not read before
+    ``deadline`` are appended to ``unscanned``.
+    """
+
+    def __init__(
+        self,
+        repo_root: Path,
+        ignore: Sequence[str] = DEFAULT_IGNORE,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        jobs: int = DEFAULT_JOBS,
+        deadline: float | None = None,
+        unscanned: list[str] | None = None,
+    ) -> None:
+        self.repo_root = repo_root
+        self.max_depth = max_depth
+        self.jobs = jobs
+        self.deadline = deadline
+        self.unscanned = [] if unscanned is None else unscanned
+        self.pruned = 0
+        self._ignored = (
+            re.compile("|".join(fnmatch.translate(pattern) for pattern in ignore)).match
+            if ignore
+            else lambda name: None
         )
-    except (FileNotFoundError, OSError):
-        return False, ""
+        self._executor = None
 
-    output = result.stdout
-    first_line = output.splitlines()[0] if output.splitlines() else ""
+    def expand(self, names: Iterable[str]) -> Iterator[str]:
+        try:
+            for name in names:
+                if not name.endswith("/"):
+                    yield name
+                elif not self._ignored(name.rstrip("/").rsplit("/", 1)[-1]):
+                    yield from self._walk(name)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _list(self, directory: str) -> tuple[list[str], list[str]]:
+        """(files, subdirectories) of one directory, as repo-relative names."""
+        files: list[str] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(self.repo_root / directory) as entries:
+                for entry in entries:
+                    if self._ignored(entry.name):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(f"{directory}{entry.name}/")
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append(f"{directory}{entry.name}")
+        except OSError:
+            pass
+        return files, subdirs
+
+    def _walk(self, top: str) -> Iterator[str]:
+        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures import TimeoutError as FutureTimeout
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.jobs)
+        waiting: deque[tuple[str, int]] = deque([(top, 0)])
+        in_flight: deque = deque()
+        while waiting or in_flight:
+            while waiting and len(in_flight) < 2 * self.jobs:
+                directory, depth = waiting.popleft()
+                in_flight.append((directory, depth, self._executor.submit(self._list, directory)))
+            directory, depth, future = in_flight.popleft()
+            try:
+                timeout = None if self.deadline is None else max(self.deadline - time.monotonic(), 0)
+                files, subdirs = future.result(timeout)
+            except FutureTimeout:
+                self.unscanned.append(directory)
+                self.unscanned.extend(name for name, _, _ in in_flight)
+                self.unscanned.extend(name for name, _ in waiting)
+                for _, _, pending in in_flight:
+                    pending.cancel()
+                return
+            yield from files
+            if depth < self.max_depth:
+                waiting.extend((subdir, depth + 1) for subdir in subdirs)
+            else:
+                self.pruned += len(subdirs)
+
+
+def _classify_label(label: str) -> bool:
+    """Apply the keyword classification to a `file`-style type description."""
     # Skip text files — "Python script text executable" is not a binary
-    if "text" in first_line:
-        return False, first_line
-    for keyword in BINARY_KEYWORDS:
-        if keyword in first_line:
-            return True, first_line
-    return False, first_line
+    if "text" in label:
+        return False
+    return any(keyword in label for keyword in BINARY_KEYWORDS)
 
 
-def main() -> None:
-    repo_root = find_repo_root(Path(__file__).parent)
-    if repo_root is None:
-        print("Warning: could not find .beads/ directory, skipping", file=sys.stderr)
-        sys.exit(0)
+def sniff_magic(head: bytes) -> str | None:
+    """Describe ELF, Mach-O, PE and text files from their leading bytes.
+
+    Returns a `file`-style label, or None when the header is not conclusive
+    and the `file` command has to decide.
+    """
+    if not head:
+        return "empty"
+    if head.startswith(b"\x7fELF") and len(head) >= 18:
+        bits = {1: "32-bit", 2: "64-bit"}.get(head[4], "")
+        order = ">" if head[5] == 2 else "<"
+        (e_type,) = struct.unpack_from(f"{order}H", head, 16)
+        parts = ("ELF", bits, "MSB" if order == ">" else "LSB", ELF_TYPES.get(e_type, "file"))
+        return " ".join(part for part in parts if part)
+    if head[:4] in MACHO_MAGICS and len(head) >= 16:
+        order, bits = MACHO_MAGICS[head[:4]]
+        (filetype,) = struct.unpack_from(f"{order}I", head, 12)
+        return f"Mach-O {bits} {MACHO_FILETYPES.get(filetype, 'file')}"
+    if head.startswith(b"MZ") and len(head) >= 0x40:
+        (pe_offset,) = struct.unpack_from("<I", head, 0x3C)
+        if head[pe_offset : pe_offset + 4] == b"PE\0\0" and len(head) >= pe_offset + 26:
+            (characteristics,) = struct.unpack_from("<H", head, pe_offset + 22)
+            (opt_magic,) = struct.unpack_from("<H", head, pe_offset + 24)
+            label = "PE32+ executable" if opt_magic == 0x20B else "PE32 executable"
+            return label + (" (DLL)" if characteristics & 0x2000 else "")
+        return None
+    if b"\0" not in head:
+        try:
+            head.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            # A multi-byte character cut off by the read limit is still text
+            if exc.start < len(head) - 3:
+                return None
+        return "text"
+    return None
+
+
+def _file_command(paths: Sequence[Path], deadline: float | None = None) -> list[str | None]:
+    """Run `file` once per batch of paths; returns one description per path.
+
+    Paths whose batch did not finish before ``deadline`` get None.
+    """
+    labels: list[str | None] = []
+    for start in range(0, len(paths), FILE_BATCH_SIZE):
+        batch = paths[start : start + FILE_BATCH_SIZE]
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        try:
+            result = subprocess.run(
+                ["file", "-N", "-r", "-0", "--", *map(str, batch)],
+                capture_output=True,
+                text=True,
+                errors="replace",
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return labels + [None] * (len(paths) - len(labels))
+        except (FileNotFoundError, OSError):
+            return labels + [""] * (len(paths) - len(labels))
+        # Each entry is "<name>\0: <description>\n", in argument order
+        entries = result.stdout.split("\0")[1:]
+        found = [entry.split("\n", 1)[0].lstrip(":").strip() for entry in entries]
+        labels.extend((found + [""] * len(batch))[: len(batch)])
+    return labels
+
+
+def _sniff_file(path: Path) -> str | None:
+    """sniff_magic() on the head of path; None if unreadable or inconclusive."""
+    try:
+        with open(path, "rb") as handle:
+            return sniff_magic(handle.read(SNIFF_BYTES))
+    except OSError:
+        return None
 
-    untracked = get_untracked_files(repo_root)
-    if not untracked:
-        sys.exit(0)
 
-    observer_script = repo_root / "scripts" / "observer_record.py"
-    if not observer_script.exists():
+class ArtifactCache:
+    """Persistent map of untracked path -> (size, mtime_ns, inode) signature,
+    classification and whether the artifact was already recorded.
+
+    Files with an unchanged signature reuse their classification. A rebuilt
+    file that classifies the same way keeps its recorded flag, so the same
+    artifact is not appended to problems.jsonl on every run. Paths that are
+    no longer untracked are dropped on save. The cache is advisory:
+    unreadable files start empty and write failures are ignored.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, list] = {}
+        self._seen: dict[str, list] = {}
+        self._dirty = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(data, dict)
+            and data.get("version") == CACHE_VERSION
+            and isinstance(data.get("entries"), dict)
+        ):
+            self._entries = data["entries"]
+
+    def get(self, name: str, signature: tuple[int, int, int]) -> tuple[bool, str] | None:
+        entry = self._entries.get(name)
+        if not entry or len(entry) != 6 or entry[:3] != list(signature):
+            return None
+        self._seen[name] = entry
+        return entry[3], entry[4]
+
+    def put(self, name: str, signature: tuple[int, int, int], result: tuple[bool, str]) -> None:
+        old = self._entries.get(name)
+        recorded = bool(old and len(old) == 6 and old[5] and old[3:5] == list(result))
+        self._seen[name] = [*signature, *result, recorded]
+        self._dirty = True
+
+    def recorded(self, name: str) -> bool:
+        entry = self._seen.get(name)
+        return bool(entry and entry[5])
+
+    def mark_recorded(self, name: str) -> None:
+        self._seen[name][5] = True
+        self._dirty = True
+
+    def save(self, prune: bool = True) -> None:
+        """Write the cache; with prune=False, entries not seen this run are kept."""
+        entries = self._seen if prune else {**self._entries, **self._seen}
+        if not self._dirty and len(entries) == len(self._entries):
+            return
+        payload = {"version": CACHE_VERSION, "entries": entries}
+        try:
+            write_atomic(self.path, json.dumps(payload, separators=(",", ":")))
+        except OSError:
+            pass
+
+
+def _signatures(repo_root: Path, names: Sequence[str]) -> dict[str, tuple[int, int, int]]:
+    """(size, mtime_ns, inode) of every name that is a regular file."""
+    signatures = {}
+    for name in names:
+        try:
+            st = os.stat(repo_root / name)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            signatures[name] = (st.st_size, st.st_mtime_ns, st.st_ino)
+    return signatures
+
+
+def _batched(items: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def scan_untracked(
+    repo_root: Path,
+    names: Iterable[str],
+    cache: ArtifactCache | None = None,
+    jobs: int = DEFAULT_JOBS,
+    deadline: float | None = None,
+    unscanned: list[str] | None = None,
+    min_size: int = 0,
+) -> Iterator[tuple[str, tuple[bool, str]]]:
+    """Classify the regular files among names as they arrive.
+
+    Yields (name, (is_binary, file_type)), not necessarily in input order.
+    Cache hits and sniffed headers are yielded straight away. Undecided
+    files are gathered into FILE_BATCH_SIZE batches for `file`, run on
+    ``jobs`` threads with at most ``jobs`` batches in flight, so sniffing
+    goes on while `file` runs. Files smaller than ``min_size`` are skipped
+    unread. Names not classified before ``deadline`` are appended to
+    ``unscanned``.
+    """
+    if unscanned is None:
+        unscanned = []
+    undecided: list[tuple[str, tuple[int, int, int]]] = []
+    in_flight: deque = deque()
+    executor = None
+
+    def submit() -> None:
+        nonlocal executor, undecided
+        if executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            executor = ThreadPoolExecutor(max_workers=jobs)
+        paths = [repo_root / name for name, _ in undecided]
+        in_flight.append((undecided, executor.submit(_file_command, paths, deadline)))
+        undecided = []
+
+    def finish(batch: list, future) -> Iterator[tuple[str, tuple[bool, str]]]:
+        for (name, signature), label in zip(batch, future.result()):
+            if label is None:
+                unscanned.append(name)
+                continue
+            result = (_classify_label(label), label)
+            if cache:
+                cache.put(name, signature, result)
+            yield name, result
+
+    batches = _batched(names, FILE_BATCH_SIZE)
+    try:
+        for batch in batches:
+            if deadline is not None and time.monotonic() >= deadline:
+                unscanned.extend(name for name, _ in undecided)
+                undecided = []
+                unscanned.extend(batch)
+                # Drain what the stream already holds; it stops at the deadline itself
+                for rest in batches:
+                    unscanned.extend(rest)
+                break
+            for name, signature in _signatures(repo_root, batch).items():
+                if signature[0] < min_size:
+                    continue
+                result = cache.get(name, signature) if cache else None
+                if result is None:
+                    label = _sniff_file(repo_root / name)
+                    if label is None:
+                        undecided.append((name, signature))
+                        continue
+                    result = (_classify_label(label), label)
+                    if cache:
+                        cache.put(name, signature, result)
+                yield name, result
+
+            # Fill each `file` call up to FILE_BATCH_SIZE paths
+            if len(undecided) >= FILE_BATCH_SIZE:
+                submit()
+            while in_flight and (len(in_flight) >= jobs or in_flight[0][1].done()):
+                yield from finish(*in_flight.popleft())
+        if undecided:
+            submit()
+        while in_flight:
+            yield from finish(*in_flight.popleft())
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _record_batch(repo_root: Path, batch: list[tuple[str, str]], cache: ArtifactCache | None) -> bool:
+    """Record one batch of binaries; False once recording is impossible."""
+    if observer_record is None:
+        print("Warning: observer_record.py not importable, skipping recording", file=sys.stderr)
+        return False
+    records = [
+        {
+            "issue_id": "auto",
+            "category": "build-artifact",
+            "severity": "low",
+            "detection_method": "post-hoc-fix",
+            "summary": f"Untracked binary: {filepath_str} ({file_type})",
+        }
+        for filepath_str, file_type in batch
+    ]
+    try:
+        recorded = observer_record.record_many(records, repo_root)
+    except (OSError, ValueError) as exc:
+        print(f"Warning: failed to record observer problems: {exc}", file=sys.stderr)
+        return False
+    for (name, _), record in zip(batch, recorded):
+        if cache:
+            cache.mark_recorded(name)
         print(
-            f"Warning: {observer_script} not found, skipping recording",
+            f"Recorded: {record['id']} [{record['category']}] {record['summary']}",
             file=sys.stderr,
         )
-        # Still check and warn, just don't record
-        for filepath_str in untracked:
-            filepath = repo_root / filepath_str
-            if not filepath.is_file():
-                continue
-            found, file_type = is_binary(filepath)
-            if found:
-                print(
-                    f"Warning: untracked binary: {filepath_str} ({file_type})",
-                    file=sys.stderr,
-                )
-        sys.exit(0)
+    return True
 
-    for filepath_str in untracked:
-        filepath = repo_root / filepath_str
-        if not filepath.is_file():
-            continue
 
-        found, file_type = is_binary(filepath)
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Detect untracked binary artifacts")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Inspect every file and re-record every binary, ignoring {CACHE_NAME}",
+    )
+    parser.add_argument(
+        "--budget-ms", type=int, default=DEFAULT_BUDGET_MS,
+        help=f"Stop scanning after this many ms, 0 for no limit (default: {DEFAULT_BUDGET_MS})",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=DEFAULT_JOBS,
+        help=f"Threads for `file` batches and directory walks (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--max-depth", type=int, default=DEFAULT_MAX_DEPTH,
+        help=f"Levels walked below an untracked directory (default: {DEFAULT_MAX_DEPTH})",
+    )
+    parser.add_argument(
+        "--min-bytes", type=int, default=DEFAULT_MIN_BYTES,
+        help=f"Skip files smaller than this (default: {DEFAULT_MIN_BYTES})",
+    )
+    parser.add_argument(
+        "--ignore", action="append", default=[], metavar="PATTERN",
+        help="Also skip names matching this glob inside untracked directories (repeatable; "
+        f"always skipped: {', '.join(DEFAULT_IGNORE)})",
+    )
+    args = parser.parse_args(argv)
+    deadline = time.monotonic() + args.budget_ms / 1000 if args.budget_ms > 0 else None
+
+    repo_root = find_repo_root(Path(__file__).parent)
+    if repo_root is None:
+        print("Warning: could not find .beads/ directory, skipping", file=sys.stderr)
+        sys.exit(0)
+
+    stream = UntrackedStream(repo_root, deadline)
+    cache = None if args.no_cache else ArtifactCache(repo_root / ".beads" / "observer" / CACHE_NAME)
+    unscanned: list[str] = []
+    jobs = max(args.jobs, 1)
+    walker = UntrackedWalker(
+        repo_root, (*DEFAULT_IGNORE, *args.ignore), args.max_depth, jobs, deadline, unscanned
+    )
+    pending: list[tuple[str, str]] = []
+    recording = True
+    for filepath_str, (found, file_type) in scan_untracked(
+        repo_root, walker.expand(stream), cache, jobs, deadline, unscanned, args.min_bytes
+    ):
         if not found:
             continue
-
         print(
             f"Warning: untracked binary: {filepath_str} ({file_type})",
             file=sys.stderr,
         )
+        # Already-recorded artifacts are reported but not appended again
+        if recording and not (cache and cache.recorded(filepath_str)):
+            pending.append((filepath_str, file_type))
+            if len(pending) >= RECORD_BATCH_SIZE:
+                recording = _record_batch(repo_root, pending, cache)
+                pending = []
+    if recording and pending:
+        _record_batch(repo_root, pending, cache)
 
-        summary = f"Untracked binary: {filepath_str} ({file_type})"
-        try:
-            subprocess.run(
-                [
-                    sys.executable,
-                    str(observer_script),
-                    "--issue-id", "auto",
-                    "--category", "build-artifact",
-                    "--severity", "low",
-                    "--detection-method", "post-hoc-fix",
-                    "--summary", summary,
-                ],
-                cwd=repo_root,
-            )
-        except OSError as exc:
-            print(f"Warning: failed to call observer_record.py: {exc}", file=sys.stderr)
+    complete = stream.complete and not unscanned
+    if not complete:
+        print(
+            f"Warning: time budget of {args.budget_ms} ms ran out; "
+            f"{len(unscanned)} untracked path(s) not scanned",
+            file=sys.stderr,
+        )
+        for filepath_str in unscanned[:UNSCANNED_SHOWN]:
+            print(f"  {filepath_str}", file=sys.stderr)
+        if len(unscanned) > UNSCANNED_SHOWN:
+            print(f"  ... and {len(unscanned) - UNSCANNED_SHOWN} more", file=sys.stderr)
+        if not stream.complete:
+            print("  git status did not finish; further untracked paths were not listed", file=sys.stderr)
+    if walker.pruned:
+        print(
+            f"Warning: {walker.pruned} dir(s) more than {args.max_depth} levels "
+            "below an untracked directory were skipped",
+            file=sys.stderr,
+        )
+    if cache:
+        cache.save(prune=complete)
 
     sys.exit(0)
 
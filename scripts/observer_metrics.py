@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Export observer problem counts as a Prometheus textfile.
+
+A checkpoint (problems.metrics.json) holds the log cursor and running
+counts by category, severity, detection_method and resolution_reason.
+Each run folds in only the records appended since the cursor, across any
+segments sealed in the meantime, and rewrites the textfile from the
+counts, so an export costs the same however large the log has grown.
+Point node_exporter's textfile collector at the output directory and run
+this from cron or a timer.
+
+Usage:
+  python3 scripts/observer_metrics.py
+  python3 scripts/observer_metrics.py --output /var/lib/node_exporter/textfile/observer.prom
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from hook_common import write_atomic
+from observer_record import find_repo_root, update_checkpoint
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_NAME = "problems.metrics.json"
+DEFAULT_OUTPUT_NAME = "problems.prom"
+
+# Label names, in checkpoint row order
+LABELS = ("category", "severity", "detection_method", "resolution_reason")
+
+# Label value for records without the field (e.g. unresolved problems)
+MISSING = "none"
+
+
+def _empty_checkpoint() -> dict:
+    return {"version": CHECKPOINT_VERSION, "cursor": None, "invalid": 0, "rows": []}
+
+
+def _fold(checkpoint: dict, records: Iterator[dict]) -> None:
+    """Add records to the checkpoint counts; see update_checkpoint."""
+    counts: dict[tuple[str, ...], int] = {tuple(row[:-1]): row[-1] for row in checkpoint["rows"]}
+    for record in records:
+        key = tuple(str(record.get(label) or MISSING) for label in LABELS)
+        counts[key] = counts.get(key, 0) + 1
+    checkpoint["rows"] = [[*key, count] for key, count in sorted(counts.items())]
+
+
+def load_checkpoint(observer_dir: Path, rebuild: bool = False) -> tuple[dict, int]:
+    """Bring the checkpoint up to date; returns (checkpoint, lines read).
+
+    Only records past the stored cursor are parsed. If the log was rewritten
+    or segments were removed, the cursor is stale and the counts are rebuilt.
+    """
+    return update_checkpoint(
+        observer_dir / CHECKPOINT_NAME, observer_dir, _empty_checkpoint, _fold, rebuild
+    )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render(checkpoint: dict, now: float | None = None) -> str:
+    """Prometheus text exposition of the checkpoint counts."""
+    lines = [
+        "# HELP observer_problems_total Observer problems recorded, by label.",
+        "# TYPE observer_problems_total counter",
+    ]
+    for *values, count in checkpoint["rows"]:
+        labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(LABELS, values))
+        lines.append(f"observer_problems_total{{{labels}}} {count}")
+    lines += [
+        "# HELP observer_problems_invalid_lines_total Log lines that were not valid JSON.",
+        "# TYPE observer_problems_invalid_lines_total counter",
+        f"observer_problems_invalid_lines_total {checkpoint['invalid']}",
+        "# HELP observer_metrics_export_timestamp_seconds When this file was written.",
+        "# TYPE observer_metrics_export_timestamp_seconds gauge",
+        f"observer_metrics_export_timestamp_seconds {time.time() if now is None else now:.3f}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export observer problems for Prometheus")
+    parser.add_argument(
+        "--output", default=None,
+        help=f"Textfile to write (default: .beads/observer/{DEFAULT_OUTPUT_NAME}; - for stdout)",
+    )
+    parser.add_argument("--rebuild", action="store_true", help="Recount the whole log")
+    args = parser.parse_args()
+
+    observer_dir = find_repo_root(Path(__file__).parent) / ".beads" / "observer"
+    try:
+        checkpoint, lines = load_checkpoint(observer_dir, rebuild=args.rebuild)
+    except (OSError, ValueError) as exc:
+        print(f"Error: cannot read observer log: {exc}", file=sys.stderr)
+        return 1
+
+    text = render(checkpoint)
+    if args.output == "-":
+        sys.stdout.write(text)
+        return 0
+    output = Path(args.output).expanduser() if args.output else observer_dir / DEFAULT_OUTPUT_NAME
+    try:
+        write_atomic(output, text)
+    except OSError as exc:
+        print(f"Error: cannot write {output}: {exc}", file=sys.stderr)
+        return 1
+    print(f"Exported {len(checkpoint['rows'])} series ({lines} new lines) to {output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
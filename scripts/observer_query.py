@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Query .beads/observer/problems.jsonl through an incremental sidecar index.
+
+The index (problems.index.json) holds record counts aggregated by day,
+category, severity and issue_id, plus the log cursor it has consumed up to.
+Each query first indexes only the records appended since then (across any
+segments sealed in the meantime), so counts and top-N summaries never
+re-parse the whole log. Rows are stored column-wise with
+interned values, which keeps the index small and quick to load.
+
+Usage:
+  python3 scripts/observer_query.py count --category build-artifact --severity critical --since 7d
+  python3 scripts/observer_query.py top category -n 5 --since 2026-01-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import datetime
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+from observer_record import find_repo_root, update_checkpoint
+
+INDEX_VERSION = 2
+INDEX_NAME = "problems.index.json"
+
+# Aggregation key, in row order; "day" is the UTC date of the timestamp
+FIELDS = ("day", "category", "severity", "issue_id")
+
+
+def _empty_index() -> dict:
+    return {
+        "version": INDEX_VERSION,
+        "cursor": None,
+        "invalid": 0,
+        "values": {field: [] for field in FIELDS},
+        "columns": {field: [] for field in (*FIELDS, "count")},
+    }
+
+
+def _record_key(record: dict) -> tuple[str, ...]:
+    day = str(record.get("timestamp", ""))[:10] or "unknown"
+    return (day,) + tuple(str(record.get(field, "")) for field in FIELDS[1:])
+
+
+def _fold(index: dict, records: Iterator[dict]) -> None:
+    """Add records to the index counts; see update_checkpoint."""
+    values = index["values"]
+    lookup = [{value: n for n, value in enumerate(values[field])} for field in FIELDS]
+    columns = index["columns"]
+    counts: dict[tuple[int, ...], int] = dict(
+        zip(zip(*(columns[field] for field in FIELDS)), columns["count"])
+    )
+    for record in records:
+        key = []
+        for pos, value in enumerate(_record_key(record)):
+            ids = lookup[pos]
+            if value not in ids:
+                ids[value] = len(ids)
+                values[FIELDS[pos]].append(value)
+            key.append(ids[value])
+        key = tuple(key)
+        counts[key] = counts.get(key, 0) + 1
+
+    keys = list(counts)
+    index["columns"] = {
+        **{field: [key[pos] for key in keys] for pos, field in enumerate(FIELDS)},
+        "count": list(counts.values()),
+    }
+
+
+def load_index(observer_dir: Path, rebuild: bool = False) -> dict:
+    """Bring the index up to date with the problems log and return it.
+
+    Only records past the stored cursor are parsed. If the log was rewritten
+    or segments were removed, the cursor is stale and the index is rebuilt.
+    """
+    index, _ = update_checkpoint(observer_dir / INDEX_NAME, observer_dir, _empty_index, _fold, rebuild)
+    return index
+
+
+def _parse_day(value: str) -> str:
+    """Accept YYYY-MM-DD or a relative age such as 7d / 2w."""
+    unit = value[-1:].lower()
+    if unit in ("d", "w") and value[:-1].isdigit():
+        days = int(value[:-1]) * (7 if unit == "w" else 1)
+        today = datetime.datetime.now(datetime.timezone.utc).date()
+        return (today - datetime.timedelta(days=days)).isoformat()
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM-DD or Nd/Nw, got '{value}'")
+
+
+def filter_rows(index: dict, args: argparse.Namespace) -> list[tuple[int, ...]]:
+    """Return (day, category, severity, issue_id, count) id tuples matching args."""
+    values = index["values"]
+    allowed: list[set[int] | None] = []
+    for field in FIELDS:
+        if field == "day":
+            if not (args.since or args.until):
+                allowed.append(None)
+                continue
+            allowed.append({
+                n for n, day in enumerate(values["day"])
+                if (not args.since or day >= args.since) and (not args.until or day <= args.until)
+            })
+            continue
+        wanted = getattr(args, field)
+        if wanted is None:
+            allowed.append(None)
+        else:
+            allowed.append({n for n, value in enumerate(values[field]) if value == wanted})
+
+    # Narrow the candidate rows one column at a time, most selective first
+    columns = index["columns"]
+    selected = range(len(columns["count"]))
+    active = sorted(
+        (len(ids) / max(len(values[field]), 1), field)
+        for field, ids in zip(FIELDS, allowed)
+        if ids is not None
+    )
+    for _, field in active:
+        ids = allowed[FIELDS.index(field)]
+        column = columns[field]
+        selected = [n for n in selected if column[n] in ids]
+    ordered = [columns[field] for field in (*FIELDS, "count")]
+    return [tuple(column[n] for column in ordered) for n in selected]
+
+
+def main() -> int:
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument("--category", help="Only this category")
+    filters.add_argument("--severity", help="Only this severity")
+    filters.add_argument("--issue-id", help="Only this issue id")
+    filters.add_argument("--since", type=_parse_day, help="From this day (YYYY-MM-DD or 7d/2w)")
+    filters.add_argument("--until", type=_parse_day, help="Up to and including this day")
+    filters.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    filters.add_argument("--reindex", action="store_true", help="Rebuild the index from scratch")
+
+    parser = argparse.ArgumentParser(description="Query observer problems")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("count", parents=[filters], help="Count matching problems")
+    top = commands.add_parser("top", parents=[filters], help="Most frequent values of a field")
+    top.add_argument("field", choices=FIELDS)
+    top.add_argument("-n", type=int, default=10, help="How many values to show (default: 10)")
+    args = parser.parse_args()
+
+    observer_dir = find_repo_root(Path(__file__).parent) / ".beads" / "observer"
+    try:
+        index = load_index(observer_dir, rebuild=args.reindex)
+    except (OSError, ValueError) as exc:
+        print(f"Error: cannot read observer log: {exc}", file=sys.stderr)
+        return 1
+    rows = filter_rows(index, args)
+
+    if args.command == "count":
+        total = sum(row[-1] for row in rows)
+        print(json.dumps({"count": total}) if args.json else total)
+        return 0
+
+    position = FIELDS.index(args.field)
+    totals: collections.Counter = collections.Counter()
+    for row in rows:
+        totals[row[position]] += row[-1]
+    names = index["values"][args.field]
+    ranked = [(names[value], count) for value, count in totals.most_common(args.n)]
+    if args.json:
+        print(json.dumps([{args.field: value, "count": count} for value, count in ranked]))
+    else:
+        for value, count in ranked:
+            print(f"{count:>8}  {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
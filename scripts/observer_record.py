@@ -1,57 +1,447 @@
 #!/usr/bin/env python3
-"""Record an observer problem to .beads/observer/problems.jsonl."""
+"""Record observer problems to .beads/observer/problems.jsonl.
+
+CLI: python3 scripts/observer_record.py --issue-id ... --summary ...
+Library: ``record_many(records)`` validates and appends many records at once.
+
+problems.jsonl is the active segment of the log. Once it passes a size or
+age limit it is sealed into problems-NNNNNN.jsonl.gz and listed in
+problems.manifest.json; LogReader and iter_records stream across sealed
+segments and the active file as one log.
+"""
+
+from __future__ import annotations
 
 import argparse
 import datetime
+import gzip
+import hashlib
 import json
+import os
 import secrets
 import sys
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
 
+from hook_common import find_repo_root as _find_repo_root
+from hook_common import ANCHOR_BYTES, load_taxonomy, read_anchor, write_atomic
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX platforms: append without locking
+    fcntl = None
+
+SEVERITIES = ("low", "medium", "high", "critical")
+DETECTION_METHODS = (
+    "lint-failure",
+    "review-comment",
+    "execution-failure",
+    "post-hoc-fix",
+    "diff-analysis",
+)
+RESOLUTION_REASONS = ("real_fix", "false_alarm", "wont_fix")
+REQUIRED_FIELDS = ("issue_id", "category", "severity", "detection_method", "summary")
+
+ACTIVE_NAME = "problems.jsonl"
+MANIFEST_NAME = "problems.manifest.json"
+MANIFEST_VERSION = 1
+
+# record_many seals the active file once it passes either limit
+ROTATE_MAX_BYTES = 8 * 1024 * 1024
+ROTATE_MAX_AGE_DAYS = 30
+
 
 def find_repo_root(start: Path) -> Path:
-    """Walk up from start until a directory containing .beads/ is found."""
-    current = start.resolve()
-    while current != current.parent:
-        if (current / ".beads").is_dir():
-            return current
-        current = current.parent
-    print("Error: could not find .beads/ directory", file=sys.stderr)
-    sys.exit(1)
+    """hook_common.find_repo_root, exiting with an error if there is none."""
+    repo_root = _find_repo_root(start)
+    if repo_root is None:
+        print("Error: could not find .beads/ directory", file=sys.stderr)
+        sys.exit(1)
+    return repo_root
+
+
+def _complete(record: dict, valid_categories: list[str]) -> dict:
+    """Validate one record and fill in id, timestamp and defaults."""
+    missing = [field for field in REQUIRED_FIELDS if not record.get(field)]
+    if missing:
+        raise ValueError(f"missing field(s): {', '.join(missing)}")
+    if record["category"] not in valid_categories:
+        raise ValueError(
+            f"invalid category '{record['category']}'. "
+            f"Valid: {', '.join(valid_categories)}"
+        )
+    for field, choices in (
+        ("severity", SEVERITIES),
+        ("detection_method", DETECTION_METHODS),
+        ("resolution_reason", RESOLUTION_REASONS),
+    ):
+        if field in record and record[field] not in choices:
+            raise ValueError(
+                f"invalid {field} '{record[field]}'. Valid: {', '.join(choices)}"
+            )
+
+    return {
+        "id": record.get("id") or f"obs-{secrets.token_hex(3)}",
+        "timestamp": record.get("timestamp")
+        or datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "issue_id": record["issue_id"],
+        "category": record["category"],
+        "severity": record["severity"],
+        "detection_method": record["detection_method"],
+        "summary": record["summary"],
+        "verified": record.get("verified", True),
+        "resolution_reason": record.get("resolution_reason", "real_fix"),
+    }
+
+
+def _lock(fd: int, exclusive: bool = True) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+
+def append_lines(path: Path, payload: bytes) -> None:
+    """Append complete JSONL lines to path atomically with respect to peers.
+
+    The file is opened with O_APPEND and held under an exclusive advisory
+    flock while the payload is written with raw os.write calls, so records
+    from concurrent writers never interleave. If a previous writer died
+    mid-line, a newline is written first so the new records stay parseable.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        _lock(fd)
+        size = os.fstat(fd).st_size
+        if size and os.pread(fd, 1, size - 1) != b"\n":
+            payload = b"\n" + payload
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        # Closing the descriptor also releases the flock
+        os.close(fd)
+
+
+def _segment_name(generation: int) -> str:
+    return f"problems-{generation:06d}.jsonl.gz"
+
+
+def load_manifest(observer_dir: Path) -> dict:
+    """Return the segment manifest; an absent one means nothing was sealed."""
+    try:
+        with open(observer_dir / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {"version": MANIFEST_VERSION, "next_generation": 1, "segments": []}
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"unsupported manifest version: {manifest.get('version')}")
+    return manifest
+
+
+def _timestamp_of(line: bytes) -> str | None:
+    try:
+        value = json.loads(line).get("timestamp")
+    except (ValueError, AttributeError):
+        return None
+    return value if isinstance(value, str) else None
+
+
+def _age_days(first_line: bytes) -> float | None:
+    timestamp = _timestamp_of(first_line)
+    if timestamp is None:
+        return None
+    try:
+        started = datetime.datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    if started.tzinfo is None:
+        started = started.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return (now - started).total_seconds() / 86400
+
+
+def seal_active(
+    observer_dir: Path,
+    max_bytes: int | None = None,
+    max_age_days: float | None = None,
+    force: bool = False,
+) -> dict | None:
+    """Seal problems.jsonl into a gzip segment if it is due for rotation.
+
+    The active file is due when it reaches ``max_bytes`` or its first record
+    is older than ``max_age_days`` (or always, with ``force``). Sealing runs
+    under the same exclusive lock as appends: the segment is written and
+    fsynced first, then the manifest, and only then is the active file
+    truncated in place, so concurrent writers and readers never lose records.
+
+    Returns the new manifest entry, or None when nothing was sealed.
+    """
+    active = observer_dir / ACTIVE_NAME
+    try:
+        fd = os.open(active, os.O_RDWR)
+    except FileNotFoundError:
+        return None
+    try:
+        _lock(fd)
+        size = os.fstat(fd).st_size
+        if not size:
+            return None
+        if not force:
+            due = max_bytes is not None and size >= max_bytes
+            if not due and max_age_days is not None:
+                age = _age_days(os.pread(fd, 64 * 1024, 0).split(b"\n", 1)[0])
+                due = age is not None and age >= max_age_days
+            if not due:
+                return None
+
+        data = os.pread(fd, size, 0)
+        manifest = load_manifest(observer_dir)
+        generation = manifest["next_generation"]
+        lines = data.splitlines()
+        entry = {
+            "generation": generation,
+            "file": _segment_name(generation),
+            "bytes": len(data),
+            "records": len(lines),
+            "first_timestamp": _timestamp_of(lines[0]) if lines else None,
+            "last_timestamp": _timestamp_of(lines[-1]) if lines else None,
+            "sealed_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
+        write_atomic(observer_dir / entry["file"], gzip.compress(data, mtime=0), durable=True)
+        manifest["segments"].append(entry)
+        manifest["next_generation"] = generation + 1
+        write_atomic(observer_dir / MANIFEST_NAME, json.dumps(manifest, indent=2), durable=True)
+        os.ftruncate(fd, 0)
+        return entry
+    finally:
+        os.close(fd)
+
+
+class StaleCursor(ValueError):
+    """A reader cursor no longer matches the log (rewritten or pruned)."""
+
+
+class LogReader:
+    """Stream raw lines across sealed segments and the active file.
+
+    A cursor is a dict of ``generation`` (segment number; the active file
+    is ``next_generation``), byte ``offset`` within it and an ``anchor``
+    hash of the bytes just before the offset. Iteration resumes after the
+    cursor and ``reader.cursor`` reflects every line yielded so far.
+    Iterating raises StaleCursor when the cursor's bytes no longer match.
+
+    Only complete lines are yielded from the active file; a line still being
+    written is picked up on the next read.
+    """
+
+    def __init__(self, observer_dir: Path, cursor: dict | None = None) -> None:
+        self.observer_dir = observer_dir
+        cursor = cursor or {}
+        self._generation = int(cursor.get("generation", 1))
+        self._offset = int(cursor.get("offset", 0))
+        self._expected_anchor = cursor.get("anchor")
+        self._tail = b""
+
+    @property
+    def cursor(self) -> dict:
+        return {
+            "generation": self._generation,
+            "offset": self._offset,
+            "anchor": hashlib.sha256(self._tail[-ANCHOR_BYTES:]).hexdigest()[:16],
+        }
+
+    def _check_anchor(self, preceding: bytes) -> None:
+        self._tail = preceding[-ANCHOR_BYTES:]
+        expected, self._expected_anchor = self._expected_anchor, None
+        if expected is not None and expected != self.cursor["anchor"]:
+            raise StaleCursor(f"log changed before generation {self._generation} offset {self._offset}")
+
+    def _advance(self, line: bytes) -> None:
+        self._offset += len(line)
+        self._tail = (self._tail + line)[-ANCHOR_BYTES:]
+
+    def _next_generation(self) -> None:
+        self._generation += 1
+        self._offset = 0
+        self._tail = b""
+        self._expected_anchor = None
+
+    def _read_segment(self, entry: dict) -> Iterator[bytes]:
+        with gzip.open(self.observer_dir / entry["file"], "rb") as f:
+            start = max(0, self._offset - ANCHOR_BYTES)
+            f.seek(start)
+            preceding = f.read(self._offset - start)
+            if start + len(preceding) != self._offset:
+                raise StaleCursor(f"segment {entry['file']} is shorter than the cursor offset")
+            self._check_anchor(preceding)
+            for line in f:
+                self._advance(line)
+                yield line
+
+    def __iter__(self) -> Iterator[bytes]:
+        active = self.observer_dir / ACTIVE_NAME
+        while True:
+            manifest = load_manifest(self.observer_dir)
+            segments = {entry["generation"]: entry for entry in manifest["segments"]}
+            if self._generation > manifest["next_generation"]:
+                raise StaleCursor(f"generation {self._generation} does not exist")
+            while self._generation < manifest["next_generation"]:
+                entry = segments.get(self._generation)
+                if entry is None:
+                    raise StaleCursor(f"segment for generation {self._generation} is missing")
+                yield from self._read_segment(entry)
+                self._next_generation()
+
+            # Sealing truncates the active file under an exclusive lock, so a
+            # shared lock gives a consistent view of the current generation.
+            try:
+                fd = os.open(active, os.O_RDONLY)
+            except FileNotFoundError:
+                if self._offset:
+                    raise StaleCursor("active log file is missing") from None
+                return
+            try:
+                _lock(fd, exclusive=False)
+                if load_manifest(self.observer_dir)["next_generation"] != self._generation:
+                    continue  # sealed meanwhile; read the new segment(s) first
+                size = os.fstat(fd).st_size
+                if size < self._offset:
+                    raise StaleCursor("active log file shrank below the cursor offset")
+                self._check_anchor(read_anchor(fd, self._offset))
+                data = os.pread(fd, size - self._offset, self._offset)
+            finally:
+                os.close(fd)
+            complete = data[: data.rfind(b"\n") + 1]
+            for line in complete.splitlines(keepends=True):
+                self._advance(line)
+                yield line
+            return
+
+
+def iter_records(observer_dir: Path) -> Iterator[dict]:
+    """Yield every parseable record across sealed segments and the active file."""
+    for line in LogReader(observer_dir):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            yield record
+
+
+def _fold_new(checkpoint: dict, reader: LogReader, fold: Callable[[dict, Iterator[dict]], None]) -> int:
+    """Feed the records reader yields to fold; returns lines read."""
+    lines = 0
+
+    def records() -> Iterator[dict]:
+        nonlocal lines
+        for line in reader:
+            lines += 1
+            try:
+                record = json.loads(line)
+            except ValueError:
+                if line.strip():
+                    checkpoint["invalid"] += 1
+                continue
+            if isinstance(record, dict):
+                yield record
+
+    fold(checkpoint, records())
+    checkpoint["cursor"] = reader.cursor
+    return lines
+
+
+def update_checkpoint(
+    path: Path,
+    observer_dir: Path,
+    empty: Callable[[], dict],
+    fold: Callable[[dict, Iterator[dict]], None],
+    rebuild: bool = False,
+) -> tuple[dict, int]:
+    """Bring a JSON checkpoint of log aggregates up to date and save it.
+
+    ``empty()`` returns a fresh checkpoint holding at least "version",
+    "cursor" (None) and "invalid" (0); a stored one with another version is
+    discarded. ``fold(checkpoint, records)`` adds the records appended
+    since the cursor. If the log was rewritten or segments were removed,
+    the cursor is stale and the checkpoint is rebuilt from the start. The
+    file is rewritten only when lines were read or ``rebuild`` is set.
+    Returns (checkpoint, lines read).
+    """
+    checkpoint = None
+    if not rebuild:
+        try:
+            checkpoint = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+    fresh = empty()
+    if not isinstance(checkpoint, dict) or checkpoint.get("version") != fresh["version"]:
+        checkpoint = fresh
+    try:
+        lines = _fold_new(checkpoint, LogReader(observer_dir, checkpoint["cursor"]), fold)
+    except StaleCursor:
+        checkpoint = empty()
+        lines = _fold_new(checkpoint, LogReader(observer_dir), fold)
+    if lines or rebuild:
+        try:
+            write_atomic(path, json.dumps(checkpoint, separators=(",", ":")))
+        except OSError as exc:
+            print(f"Warning: cannot write {path}: {exc}", file=sys.stderr)
+    return checkpoint, lines
+
+
+def record_many(
+    records: Iterable[dict],
+    repo_root: Path | None = None,
+    taxonomy: dict | None = None,
+) -> list[dict]:
+    """Validate records and append them to problems.jsonl in one write.
+
+    The taxonomy is loaded once per call. Every record is validated before
+    anything is written, so a bad record leaves the log untouched. The write
+    goes through append_lines, under an exclusive lock on problems.jsonl,
+    after which the active file is sealed if it passed the rotation limits.
+    Sealing is best-effort: the records are already persisted, so a failure
+    there only warns and the next call (or observer_rotate.py) retries it.
+
+    Raises ValueError for invalid records and OSError for append failures.
+    Returns the records as written, with generated ids and timestamps.
+    """
+    records = list(records)
+    if not records:
+        return []
+    if repo_root is None:
+        repo_root = find_repo_root(Path(__file__).parent)
+    if taxonomy is None:
+        taxonomy = load_taxonomy(repo_root)
+    valid_categories = list(taxonomy["categories"].keys())
+
+    completed = [_complete(record, valid_categories) for record in records]
+
+    payload = "".join(json.dumps(record) + "\n" for record in completed)
+    observer_dir = repo_root / ".beads" / "observer"
+    append_lines(observer_dir / ACTIVE_NAME, payload.encode("utf-8"))
+    try:
+        seal_active(observer_dir, ROTATE_MAX_BYTES, ROTATE_MAX_AGE_DAYS)
+    except (OSError, ValueError) as exc:
+        print(f"Warning: recorded, but could not rotate {ACTIVE_NAME}: {exc}", file=sys.stderr)
+    return completed
 
 
 def main() -> None:
     repo_root = find_repo_root(Path(__file__).parent)
-    taxonomy_path = repo_root / ".beads" / "observer" / "taxonomy.json"
 
     try:
-        with open(taxonomy_path) as f:
-            taxonomy = json.load(f)
+        taxonomy = load_taxonomy(repo_root)
     except (OSError, json.JSONDecodeError) as exc:
         print(f"Error: cannot load taxonomy: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    valid_categories = list(taxonomy["categories"].keys())
-
     parser = argparse.ArgumentParser(description="Record an observer problem")
     parser.add_argument("--issue-id", required=True, help="Issue identifier")
     parser.add_argument("--category", required=True, help="Problem category")
-    parser.add_argument(
-        "--severity",
-        required=True,
-        choices=["low", "medium", "high", "critical"],
-    )
-    parser.add_argument(
-        "--detection-method",
-        required=True,
-        choices=[
-            "lint-failure",
-            "review-comment",
-            "execution-failure",
-            "post-hoc-fix",
-            "diff-analysis",
-        ],
-    )
+    parser.add_argument("--severity", required=True, choices=SEVERITIES)
+    parser.add_argument("--detection-method", required=True, choices=DETECTION_METHODS)
     parser.add_argument("--summary", required=True, help="Problem summary")
     parser.add_argument(
         "--verified",
@@ -61,23 +451,13 @@ def main() -> None:
     )
     parser.add_argument(
         "--resolution-reason",
-        choices=["real_fix", "false_alarm", "wont_fix"],
+        choices=RESOLUTION_REASONS,
         default="real_fix",
     )
 
     args = parser.parse_args()
 
-    if args.category not in valid_categories:
-        print(
-            f"Error: invalid category '{args.category}'. "
-            f"Valid: {', '.join(valid_categories)}",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-
     record = {
-        "id": f"obs-{secrets.token_hex(3)}",
-        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
         "issue_id": args.issue_id,
         "category": args.category,
         "severity": args.severity,
@@ -87,11 +467,13 @@ def main() -> None:
         "resolution_reason": args.resolution_reason,
     }
 
-    problems_path = repo_root / ".beads" / "observer" / "problems.jsonl"
     try:
-        with open(problems_path, "a") as f:
-            f.write(json.dumps(record) + "\n")
+        (record,) = record_many([record], repo_root, taxonomy)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
     except OSError as exc:
+        problems_path = repo_root / ".beads" / "observer" / "problems.jsonl"
         print(f"Error: cannot write to {problems_path}: {exc}", file=sys.stderr)
         sys.exit(1)
 
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Seal .beads/observer/problems.jsonl into a compressed segment.
+
+record_many already rotates automatically at ROTATE_MAX_BYTES or
+ROTATE_MAX_AGE_DAYS; this command applies other limits or forces a seal.
+
+Usage: task observer:rotate -- [--max-bytes N] [--max-age-days D] [--force]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from observer_record import (
+    ROTATE_MAX_AGE_DAYS,
+    ROTATE_MAX_BYTES,
+    find_repo_root,
+    load_manifest,
+    seal_active,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rotate the observer problems log")
+    parser.add_argument(
+        "--max-bytes", type=int, default=ROTATE_MAX_BYTES,
+        help=f"Seal once the active file reaches this size (default: {ROTATE_MAX_BYTES})",
+    )
+    parser.add_argument(
+        "--max-age-days", type=float, default=ROTATE_MAX_AGE_DAYS,
+        help=f"Seal once the oldest active record is this old (default: {ROTATE_MAX_AGE_DAYS})",
+    )
+    parser.add_argument("--force", action="store_true", help="Seal regardless of limits")
+    args = parser.parse_args()
+
+    observer_dir = find_repo_root(Path(__file__).parent) / ".beads" / "observer"
+    try:
+        entry = seal_active(observer_dir, args.max_bytes, args.max_age_days, args.force)
+        manifest = load_manifest(observer_dir)
+    except (OSError, ValueError) as exc:
+        print(f"Error: cannot rotate: {exc}", file=sys.stderr)
+        return 1
+
+    if entry is None:
+        print("Active log not due for rotation", file=sys.stderr)
+    else:
+        print(
+            f"Sealed: {entry['file']} ({entry['records']} records, {entry['bytes']} bytes)",
+            file=sys.stderr,
+        )
+    print(f"Segments: {len(manifest['segments'])}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Stress concurrent appends to problems.jsonl through observer_record.
+
+Spawns many writer processes against a throwaway .beads/ tree, each calling
+record_many repeatedly with a mix of small and large (> PIPE_BUF) records,
+then checks that every line of the result is valid JSON, that no record was
+lost or duplicated, and that throughput stays above --min-rate. The large
+records push the log past ROTATE_MAX_BYTES, so sealing races with appends.
+
+Usage: task observer:stress
+Or run directly: python3 scripts/observer_stress.py --writers 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import observer_record
+
+
+def _writer(repo_root: Path, writer: int, batches: int, batch_size: int, large: int) -> None:
+    taxonomy = observer_record.load_taxonomy(repo_root)
+    for batch in range(batches):
+        records = []
+        for n in range(batch_size):
+            # Every third batch carries one oversized summary
+            size = large if batch % 3 == 0 and n == 0 else 64
+            records.append(
+                {
+                    "id": f"stress-{writer}-{batch}-{n}",
+                    "issue_id": f"writer-{writer}",
+                    "category": "stress",
+                    "severity": "low",
+                    "detection_method": "execution-failure",
+                    "summary": f"{writer}:{batch}:{n}:" + "x" * size,
+                }
+            )
+        observer_record.record_many(records, repo_root, taxonomy)
+
+
+def run(writers: int, batches: int, batch_size: int, large: int) -> tuple[list[str], int, float]:
+    """Run the stress scenario; returns (problems, record count, seconds)."""
+    with tempfile.TemporaryDirectory(prefix="observer-stress-") as tmp:
+        repo_root = Path(tmp)
+        observer_dir = repo_root / ".beads" / "observer"
+        observer_dir.mkdir(parents=True)
+        (observer_dir / "taxonomy.json").write_text(json.dumps({"categories": {"stress": {}}}))
+
+        procs = [
+            multiprocessing.Process(
+                target=_writer, args=(repo_root, writer, batches, batch_size, large)
+            )
+            for writer in range(writers)
+        ]
+        start = time.perf_counter()
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+        elapsed = time.perf_counter() - start
+
+        problems = [f"writer exited with {p.exitcode}" for p in procs if p.exitcode]
+        expected = writers * batches * batch_size
+        seen: set[str] = set()
+        for lineno, line in enumerate(observer_record.LogReader(observer_dir), start=1):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                problems.append(f"line {lineno}: invalid JSON ({exc.msg})")
+                continue
+            if record["id"] in seen:
+                problems.append(f"line {lineno}: duplicate record {record['id']}")
+            seen.add(record["id"])
+        if len(seen) != expected:
+            problems.append(f"expected {expected} records, found {len(seen)}")
+        return problems, len(seen), elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stress concurrent observer appends.")
+    parser.add_argument("--writers", type=int, default=32, help="Writer processes (default: 32)")
+    parser.add_argument("--batches", type=int, default=50, help="record_many calls per writer (default: 50)")
+    parser.add_argument("--batch-size", type=int, default=4, help="Records per call (default: 4)")
+    parser.add_argument(
+        "--large-bytes", type=int, default=256 * 1024,
+        help="Size of the oversized summaries (default: 262144)",
+    )
+    parser.add_argument(
+        "--min-rate", type=float, default=1000.0,
+        help="Fail below this many records/s (default: 1000)",
+    )
+    args = parser.parse_args()
+
+    problems, count, elapsed = run(args.writers, args.batches, args.batch_size, args.large_bytes)
+    rate = count / elapsed if elapsed else float("inf")
+    print(f"{args.writers} writers, {count} records in {elapsed:.2f}s ({rate:,.0f} records/s)")
+    if rate < args.min_rate:
+        problems.append(f"throughput {rate:,.0f} records/s below --min-rate {args.min_rate:,.0f}")
+    for problem in problems[:20]:
+        print(f"[FAIL] {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())